@@ -1,10 +1,27 @@
+import mmap
 import sys
+from array import array
 from pathlib import Path
+from typing import NamedTuple
+
+try:
+    import numpy as np
+except ImportError:      # NumPy e opțional: fără el, accepts_many rulează pur Python
+    np = None
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))   # rădăcina repo-ului
+import lfa_parser
+
+# Secțiunile recunoscute într-un fișier .dfa; parsarea (comentarii, linii
+# goale, anteturi) este cea comună din lfa_parser.
+SECTIONS = ("States", "Symbols", "Start", "Final", "Rules")
+
 
 # ------------------------------------------------------------
 # Funcție: load_dfa
 #
-# Citește descrierea unui DFA dintr-un fișier și returnează componentele sale:
+# Citește descrierea unui DFA dintr-un fișier și returnează componentele sale
+# (parsarea e făcută de lfa_parser.parse, cu cache pe disc):
 #   - Q: lista stărilor
 #   - Σ: lista simbolurilor (alfabetul)
 #   - q0: starea de start
@@ -32,62 +49,32 @@ from pathlib import Path
 # Comentariile din fișier încep cu “#” și sunt ignorate. Liniile goale sunt sărite.
 #
 def load_dfa(filepath: str):
-    # Inițializează un dicționar pentru a reține liniile fiecărei secțiuni
-    cfg = {
-        "States": [],    # Lista tuturor stărilor (Q)
-        "Symbols": [],   # Lista simbolurilor de intrare (Σ)
-        "Start": [],     # Exact o stare de start
-        "Final": [],     # Zero sau mai multe stări finale (F)
-        "Rules": []      # Lista regulilor de tranziție (neparse)
-    }
-
-    section = None  # Ține evidența secțiunii curente în timpul parsării
-
-    # Deschide fișierul DFA și citește linie cu linie
-    with open(filepath, encoding="utf-8") as fh:
-        for raw in fh:
-            line = raw.strip()
-
-            # Elimină comentariile inline care încep cu “#”
-            if "#" in line:
-                line = line.split("#", 1)[0].rstrip()
-
-            # Sare peste liniile goale sau cele care erau doar comentarii
-            if not line or line.startswith("#"):
-                continue
-
-            # Detectează un antet de secțiune, de forma “[States]”
-            if line.startswith("[") and line.endswith("]"):
-                section = line[1:-1]  # Extrage textul fără paranteze
-                if section not in cfg:
-                    # Dacă numele secțiunii nu este recunoscut, aruncă eroare
-                    raise ValueError(f"Secțiune necunoscută: {section}")
-                continue
-
-            # Dacă suntem într-o secțiune permisă, adaugă linia la lista ei
-            cfg[section].append(line)
+    # Liniile fiecărei secțiuni, ca tupluri de simboluri
+    cfg = {k: [] for k in SECTIONS}
+    cfg.update(lfa_parser.parse(filepath, SECTIONS))
 
     # După citirea fișierului, extrage componentele DFA-ului
-    Q   = cfg["States"]                # Toate stările
-    Σ   = cfg["Symbols"]               # Simbolurile alfabetului
+    Q   = lfa_parser.joined(cfg["States"])    # Toate stările
+    Σ   = lfa_parser.joined(cfg["Symbols"])   # Simbolurile alfabetului
     # Dacă nu s-a specificat nicio stare de start, se folosește prima stare din Q
-    q0  = cfg["Start"][0] if cfg["Start"] else Q[0]
+    q0  = " ".join(cfg["Start"][0]) if cfg["Start"] else Q[0]
     # Transformă stările finale într-un set pentru verificări rapide; implicit, set vid
-    F   = set(cfg["Final"] if cfg["Final"] else [])
+    F   = set(lfa_parser.joined(cfg["Final"]))
 
     # Construiește dicționarul de tranziții δ
     δ   = {}  # Cheile vor fi tupluri (stare, simbol), iar valorile vor fi starea următoare
 
     # Parcurge fiecare linie din secțiunea [Rules], format “src sym dst”
+    alphabet = set(Σ)
     for rule in cfg["Rules"]:
         try:
-            src, sym, dst = rule.split()
+            src, sym, dst = rule
         except ValueError:
-            # Dacă împărțirea nu produce exact trei părți, regula este invalidă
-            raise ValueError(f"Regulă invalidă: »{rule}«")
+            # Dacă linia nu are exact trei părți, regula este invalidă
+            raise ValueError(f"Regulă invalidă: »{' '.join(rule)}«")
 
         # Verifică dacă simbolul apare în alfabetul Σ
-        if sym not in Σ:
+        if sym not in alphabet:
             raise ValueError(f"Simbol «{sym}» nu e listat în [Symbols]")
 
         key = (src, sym)
@@ -108,13 +95,35 @@ def load_dfa(filepath: str):
     return Q, Σ, q0, F, δ
 
 
+# ------------------------------------------------------------
+# Funcție: save_dfa
+#
+# Operația inversă lui load_dfa: scrie componentele unui DFA într-un fișier,
+# în același format cu secțiuni [States]/[Symbols]/[Start]/[Final]/[Rules],
+# astfel încât rezultatul să poată fi reîncărcat cu load_dfa.
+#
+def save_dfa(filepath: str, Q, Σ, q0, F, δ, *, comment: str = ""):
+    lines = [f"# {comment}", ""] if comment else []
+    lines += ["[States]", *Q, ""]
+    lines += ["[Symbols]", *Σ, ""]
+    lines += ["[Start]", q0, ""]
+    lines += ["[Final]", *[q for q in Q if q in F], ""]
+    lines += ["[Rules]"]
+    lines += [f"{q} {sym} {δ[(q, sym)]}" for q in Q for sym in Σ]
+
+    with open(filepath, "w", encoding="utf-8") as fh:
+        fh.write("\n".join(lines) + "\n")
+
+
 # ------------------------------------------------------------
 # Funcție: accepts
 #
 # Dat fiind un șir (word) și componentele unui DFA, decide dacă
 # DFA-ul acceptă șirul. Întoarce True dacă este acceptat, False altfel.
+# Dacă se dă și mulțimea `dead` (vezi dead_states), cuvântul este respins
+# imediat ce se ajunge într-o stare capcană, fără a mai citi restul lui.
 #
-def accepts(word: str, *, start: str, finals: set, delta: dict):
+def accepts(word: str, *, start: str, finals: set, delta: dict, dead: set = frozenset()):
     state = start  # Începe în starea de start
 
     # Procesează fiecare caracter din cuvânt, pe rând
@@ -125,22 +134,394 @@ def accepts(word: str, *, start: str, finals: set, delta: dict):
             return False
         # Treci în starea următoare conform funcției δ
         state = delta[key]
+        # Din starea capcană nu se mai poate ajunge într-o stare finală
+        if state in dead:
+            return False
 
     # După procesarea tuturor simbolurilor, acceptă dacă starea curentă e finală
     return state in finals
 
 
+# ------------------------------------------------------------
+# Funcție: dead_states
+#
+# Determină stările capcană: stările nefinale din care nu există niciun drum
+# către o stare din F. Se face o parcurgere înapoi (pe δ inversat) pornind
+# din stările finale; ce rămâne nevizitat este capcană.
+#
+def dead_states(Q, F, δ):
+    # Graful invers: dst -> lista stărilor care ajung în dst printr-un simbol
+    rev = {q: [] for q in Q}
+    for (src, _sym), dst in δ.items():
+        rev[dst].append(src)
+
+    alive = set(F)
+    stack = list(F)
+    while stack:
+        q = stack.pop()
+        for prev in rev[q]:
+            if prev not in alive:
+                alive.add(prev)
+                stack.append(prev)
+
+    return {q for q in Q if q not in alive}
+
+
+# ------------------------------------------------------------
+# Clasă: CompiledDFA
+#
+# Forma „compilată” a unui DFA: stările primesc indici întregi, simbolurile
+# sunt grupate în clase de echivalență (simboluri cu aceeași coloană în δ,
+# adică duc fiecare stare în aceeași stare), iar δ devine un tabel dens cu
+# o coloană pentru fiecare clasă, liniarizat pe rânduri:
+#   table[i * ncols + c] = indicele stării următoare din starea i pe clasa c
+#
+#   - states:  numele stărilor, în ordinea indicilor
+#   - symbols: simbolurile alfabetului, în ordinea din [Symbols]
+#   - columns: dicționar simbol -> indicele clasei sale (coloana din tabel)
+#   - ncols:   numărul de clase, adică de coloane ale tabelului
+#   - start:   indicele stării de start
+#   - finals:  bytes de lungime |Q|, finals[i] == 1 dacă starea i e finală
+#   - dead:    bytes de lungime |Q|, dead[i] == 1 dacă starea i e capcană
+#   - table:   array('i') de lungime |Q| * ncols
+#   - lut:     array('i') indexat după codul Unicode al unui caracter,
+#              cu clasa simbolului sau -1
+#
+class CompiledDFA(NamedTuple):
+    states: list
+    symbols: list
+    columns: dict
+    ncols: int
+    start: int
+    finals: bytes
+    dead: bytes
+    table: array
+    lut: array
+
+
+# ------------------------------------------------------------
+# Funcție: compile_dfa
+#
+# Primește componentele întoarse de load_dfa și construiește un CompiledDFA.
+#
+def compile_dfa(Q, Σ, q0, F, δ):
+    state_ids = {q: i for i, q in enumerate(Q)}
+
+    # Coloana fiecărui simbol: starea următoare pentru fiecare stare, în ordine
+    cols = {sym: array("i", [state_ids[δ[(q, sym)]] for q in Q]) for sym in Σ}
+
+    finals = bytes(1 if q in F else 0 for q in Q)
+    return _build_compiled(list(Q), list(Σ), state_ids[q0], finals, cols)
+
+
+# ------------------------------------------------------------
+# Funcție: load_dfa_compact
+#
+# Încarcă un fișier .dfa direct în forma compilată, fără a construi
+# dicționarul δ cu |Q|·|Σ| intrări: regulile sunt scrise pe loc în câte un
+# array('i') pe simbol, iar coloanele identice se contopesc apoi în clase.
+# Face aceleași verificări ca load_dfa. Fișierul este citit de două ori:
+# o dată pentru stări/alfabet, o dată pentru [Rules].
+#
+def load_dfa_compact(filepath: str):
+    cfg = {"States": [], "Symbols": [], "Start": [], "Final": []}
+    for section, line in lfa_parser.iter_lines(filepath, SECTIONS):
+        if section != "Rules":
+            cfg[section].append(" ".join(line))
+
+    Q  = cfg["States"]
+    Σ  = cfg["Symbols"]
+    q0 = cfg["Start"][0] if cfg["Start"] else Q[0]
+    F  = set(cfg["Final"])
+    state_ids = {q: i for i, q in enumerate(Q)}
+
+    # -1 marchează o tranziție încă nelistată
+    cols = {sym: array("i", [-1]) * len(Q) for sym in Σ}
+
+    for section, rule in lfa_parser.iter_lines(filepath, SECTIONS):
+        if section != "Rules":
+            continue
+        try:
+            src, sym, dst = rule
+        except ValueError:
+            raise ValueError(f"Regulă invalidă: »{' '.join(rule)}«")
+
+        col = cols.get(sym)
+        if col is None:
+            raise ValueError(f"Simbol «{sym}» nu e listat în [Symbols]")
+        if src not in state_ids or dst not in state_ids:
+            raise ValueError(f"Regula »{' '.join(rule)}« folosește o stare nelistată în [States]")
+
+        i = state_ids[src]
+        if col[i] != -1:
+            raise ValueError(f"DFA trebuie să fie determinist – dublă tranziție pentru {(src, sym)}")
+        col[i] = state_ids[dst]
+
+    for sym, col in cols.items():
+        if -1 in col:
+            raise ValueError(f"Lipsește tranziția ({Q[col.index(-1)]}, {sym}) în [Rules]")
+
+    finals = bytes(1 if q in F else 0 for q in Q)
+    return _build_compiled(Q, Σ, state_ids[q0], finals, cols)
+
+
+# ------------------------------------------------------------
+# Funcție: _build_compiled
+#
+# Partea comună a lui compile_dfa și load_dfa_compact: grupează simbolurile
+# după coloana lor (cols: simbol -> array('i') cu |Q| stări următoare),
+# construiește tabelul dens pe clase, masca stărilor capcană și `lut`.
+# Simbolurile de mai multe caractere nu pot apărea într-un cuvânt parcurs
+# caracter cu caracter, așa că nu primesc intrare în `lut`.
+#
+def _build_compiled(states, symbols, start, finals, cols):
+    nstates = len(states)
+
+    # Clase de echivalență: simbolurile cu coloane identice primesc aceeași clasă
+    class_of = {}   # octeții coloanei -> indicele clasei
+    reps     = []   # indicele clasei -> coloana reprezentativă
+    columns  = {}
+    for sym in symbols:
+        col = cols[sym]
+        key = col.tobytes()
+        c = class_of.get(key)
+        if c is None:
+            c = class_of[key] = len(reps)
+            reps.append(col)
+        columns[sym] = c
+    ncols = len(reps)
+
+    # Tabelul dens: câte un rând de `ncols` intrări pentru fiecare stare
+    table = array("i", bytes(4 * nstates * ncols))
+    for c, col in enumerate(reps):
+        table[c::ncols] = col
+
+    dead = _dead_mask(nstates, ncols, table, finals)
+
+    # Tabel de căutare după codul caracterului
+    single = [sym for sym in symbols if len(sym) == 1]
+    lut = array("i", [-1]) * (max(map(ord, single), default=-1) + 1)
+    for sym in single:
+        lut[ord(sym)] = columns[sym]
+
+    return CompiledDFA(states, symbols, columns, ncols, start, finals, dead, table, lut)
+
+
+# ------------------------------------------------------------
+# Funcție: _dead_mask
+#
+# Varianta lui dead_states pe tabelul dens: parcurgere înapoi din stările
+# finale; întoarce bytes cu 1 pentru stările din care F nu e accesibil.
+#
+def _dead_mask(nstates, ncols, table, finals):
+    rev = [[] for _ in range(nstates)]
+    for i in range(nstates):
+        for dst in set(table[i * ncols:(i + 1) * ncols]):
+            rev[dst].append(i)
+
+    alive = bytearray(finals)
+    stack = [i for i in range(nstates) if finals[i]]
+    while stack:
+        q = stack.pop()
+        for prev in rev[q]:
+            if not alive[prev]:
+                alive[prev] = 1
+                stack.append(prev)
+
+    return bytes(1 - a for a in alive)
+
+
+# ------------------------------------------------------------
+# Funcție: accepts_compiled
+#
+# Echivalentul lui `accepts`, dar pe tabelul dens: un pas costă o căutare
+# de coloană și o indexare în array, fără tupluri construite pe fiecare caracter.
+#
+def accepts_compiled(word: str, dfa: CompiledDFA):
+    table, columns, ncols, dead = dfa.table, dfa.columns, dfa.ncols, dfa.dead
+    state = dfa.start
+    for ch in word:
+        c = columns.get(ch)
+        if c is None:
+            return False  # simbol din afara alfabetului => respins
+        state = table[state * ncols + c]
+        if dead[state]:
+            return False  # stare capcană => respins fără a citi restul
+    return dfa.finals[state] == 1
+
+
+# ------------------------------------------------------------
+# Funcție: accepts_many
+#
+# Decide acceptarea pentru un lot întreg de cuvinte; întoarce o listă de bool,
+# în ordinea cuvintelor primite.
+#
+# Cu NumPy, cuvintele sunt sortate după lungime și avansate simultan, coloană
+# cu coloană: la pasul j, toate cuvintele mai lungi de j fac un singur
+# „gather” în tabelul de tranziții. Fără NumPy, se aplică accepts_compiled
+# pe fiecare cuvânt.
+#
+def accepts_many(words, dfa: CompiledDFA, *, batch_size=65536):
+    words = list(words)
+    if np is None:
+        return [accepts_compiled(w, dfa) for w in words]
+
+    nstates, ncols = len(dfa.states), dfa.ncols
+    reject  = nstates   # stare suplimentară în care ajung simbolurile necunoscute
+    unknown = ncols     # coloană suplimentară pentru simbolurile din afara lui Σ
+
+    # Tabelul extins: (|Q| + 1) x (ncols + 1), liniarizat
+    ext = np.full((nstates + 1, ncols + 1), reject, dtype=np.int64)
+    ext[:nstates, :ncols] = np.frombuffer(dfa.table, dtype=np.int32).reshape(nstates, ncols)
+    ext = ext.ravel()
+    width = ncols + 1
+
+    finals = np.zeros(nstates + 1, dtype=bool)
+    finals[:nstates] = np.frombuffer(dfa.finals, dtype=np.uint8) == 1
+    dead = np.ones(nstates + 1, dtype=bool)
+    dead[:nstates] = np.frombuffer(dfa.dead, dtype=np.uint8) == 1
+
+    lut = np.frombuffer(dfa.lut, dtype=np.int32).astype(np.int64)
+    lut[lut < 0] = unknown
+
+    lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words))
+    order   = np.argsort(lengths, kind="stable")
+    result  = np.zeros(len(words), dtype=bool)
+
+    for lo in range(0, len(words), batch_size):
+        idx  = order[lo:lo + batch_size]
+        lens = lengths[idx]
+        maxlen = int(lens[-1]) if len(idx) else 0
+
+        # Toate caracterele lotului, ca și coduri Unicode, apoi ca indici de coloană
+        codes = np.frombuffer("".join(words[i] for i in idx).encode("utf-32-le"), dtype=np.uint32)
+        cols  = np.full(codes.shape, unknown, dtype=np.int64)
+        known = codes < len(lut)
+        cols[known] = lut[codes[known]]
+
+        # Matricea lot x maxlen; celulele de după sfârșitul cuvântului rămân nefolosite
+        mat = np.zeros((len(idx), maxlen), dtype=np.int64)
+        mat[np.arange(maxlen) < lens[:, None]] = cols
+
+        states = np.full(len(idx), dfa.start, dtype=np.int64)
+        for j in range(maxlen):
+            # Cuvintele sunt sortate crescător după lungime: cele încă active
+            # formează un sufix al lotului
+            k = int(np.searchsorted(lens, j, side="right"))
+            states[k:] = ext[states[k:] * width + mat[k:, j]]
+            # Din când în când verificăm dacă tot lotul activ a ajuns în capcane
+            if j % 64 == 63 and dead[states[k:]].all():
+                break
+
+        result[idx] = finals[states]
+
+    return result.tolist()
+
+
+# ------------------------------------------------------------
+# Funcție: iter_chunks
+#
+# Produce conținutul unui fișier în blocuri de octeți. Un fișier obișnuit
+# este mapat în memorie (mmap), iar „-” înseamnă stdin, citit pe bucăți.
+#
+def iter_chunks(path: str, chunk_size: int = 1 << 22):
+    if path == "-":
+        src = sys.stdin.buffer
+        while True:
+            block = src.read(chunk_size)
+            if not block:
+                return
+            yield block
+
+    with open(path, "rb") as fh:
+        size = Path(path).stat().st_size
+        if size == 0:
+            return  # mmap nu acceptă fișiere goale
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for pos in range(0, size, chunk_size):
+                yield mm[pos:pos + chunk_size]
+
+
+# ------------------------------------------------------------
+# Funcție: iter_records
+#
+# Împarte fluxul de octeți în înregistrări (implicit: linii) și produce loturi
+# de cuvinte decodate UTF-8. O înregistrare tăiată între două blocuri este
+# reîntregită. Un „\r” final este eliminat, ca să meargă și fișierele Windows.
+#
+def iter_records(path: str, sep: bytes = b"\n", chunk_size: int = 1 << 22):
+    rest = b""
+    for block in iter_chunks(path, chunk_size):
+        parts = (rest + block).split(sep)
+        rest = parts.pop()  # ultima bucată poate fi incompletă
+        if parts:
+            yield [p.rstrip(b"\r").decode("utf-8", "replace") for p in parts]
+    if rest:
+        yield [rest.rstrip(b"\r").decode("utf-8", "replace")]
+
+
+# ------------------------------------------------------------
+# Funcție: scan_stream
+#
+# Mod neinteractiv: fiecare înregistrare din `path` este un cuvânt, iar pentru
+# fiecare se scrie câte o linie ACCEPTAT/RESPINS în `out` (un flux binar).
+# Verdictele unui lot se scriu dintr-o singură operație. Întoarce perechea
+# (număr de cuvinte, număr de cuvinte acceptate).
+#
+def scan_stream(path: str, dfa: CompiledDFA, out, *, sep: bytes = b"\n"):
+    total = accepted = 0
+    for words in iter_records(path, sep):
+        verdicts = accepts_many(words, dfa)
+        out.write(b"".join(b"ACCEPTAT\n" if v else b"RESPINS\n" for v in verdicts))
+        total += len(verdicts)
+        accepted += sum(verdicts)
+    out.flush()
+    return total, accepted
+
+
 # ------------------------------------------------------------
 # Punctul de intrare principal: când scriptul este rulat direct
 #
 if __name__ == "__main__":
-    # Verifică argumentele din linia de comandă: se așteaptă exact un argument (fișierul .dfa)
-    if len(sys.argv) != 2:
-        print("Utilizare: python dfa.py <automat.dfa>")
-        sys.exit(1)
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Simulator DFA")
+    parser.add_argument("automat", help="fișierul .dfa (sau .dfab, compilat cu dfa_bin.py, pentru --stream)")
+    parser.add_argument("--stream", metavar="FIȘIER",
+                        help="verifică fiecare linie din FIȘIER („-” = stdin), fără mod interactiv")
+    parser.add_argument("--minimize", action="store_true",
+                        help="minimizează automatul (Hopcroft) înainte de folosire")
+    parser.add_argument("--save", metavar="FIȘIER",
+                        help="scrie automatul (eventual minimizat) în FIȘIER, în format .dfa")
+    args = parser.parse_args()
 
     # Încarcă definiția DFA din fișierul specificat
-    Q, Σ, q0, F, δ = load_dfa(sys.argv[1])
+    if args.stream and not (args.minimize or args.save):
+        # Pentru scanare ajunge forma compilată; δ ca dicționar nu mai e construit.
+        # Un automat compilat în format binar (dfa_bin.py) este doar mapat în memorie.
+        from dfa_bin import is_binary, load_bin
+        loader = load_bin if is_binary(args.automat) else load_dfa_compact
+        scan_stream(args.stream, loader(args.automat), sys.stdout.buffer)
+        sys.exit(0)
+
+    Q, Σ, q0, F, δ = load_dfa(args.automat)
+
+    if args.minimize:
+        from minimize import minimize_dfa
+        n = len(Q)
+        Q, Σ, q0, F, δ = minimize_dfa(Q, Σ, q0, F, δ)
+        print(f"Minimizare: {n} -> {len(Q)} stări", file=sys.stderr)
+
+    if args.save:
+        save_dfa(args.save, Q, Σ, q0, F, δ, comment=f"generat din {Path(args.automat).name}")
+        if not args.stream:
+            sys.exit(0)
+
+    if args.stream:
+        scan_stream(args.stream, compile_dfa(Q, Σ, q0, F, δ), sys.stdout.buffer)
+        sys.exit(0)
+
+    D = dead_states(Q, F, δ)
 
     print("Introduceți cuvinte (Enter „”, stop, exit => ieșire):")
     while True:
@@ -151,5 +532,5 @@ if __name__ == "__main__":
             break
 
         # Verifică acceptarea cuvântului w și afișează rezultatul
-        verdict = accepts(w, start=q0, finals=F, delta=δ)
+        verdict = accepts(w, start=q0, finals=F, delta=δ, dead=D)
         print("ACCEPTAT" if verdict else "RESPINS")
\ No newline at end of file
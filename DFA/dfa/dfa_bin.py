@@ -0,0 +1,123 @@
+"""
+dfa_bin.py  –  Format binar pentru DFA-uri compilate, încărcat prin mmap
+
+Parsarea textului .dfa domină pornirea pentru automate cu sute de mii de
+reguli. Aici un CompiledDFA (vezi dfa.py) este scris o singură dată într-un
+fișier binar, iar la pornire fișierul este doar mapat în memorie: tabelul de
+tranziții și `lut` sunt vederi (memoryview) direct peste paginile fișierului,
+deci mai multe procese care încarcă același fișier împart aceleași pagini.
+
+FORMAT (ordinea octeților: cea nativă, verificată prin câmpul `marker`):
+
+    antet        MAGIC (8 octeți) + 7 x uint32:
+                 marker, nstates, nsymbols, ncols, start, lut_len, names_len
+    finals       nstates octeți (0/1)
+    dead         nstates octeți (0/1)
+    (umplutură până la multiplu de 4)
+    table        nstates * ncols x int32
+    lut          lut_len x int32
+    classes      nsymbols x int32 – clasa fiecărui simbol
+    names        UTF-8: numele stărilor, apoi simbolurile, separate prin '\\n'
+
+Utilizare:
+    python dfa_bin.py automat.dfa automat.dfab
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+
+from dfa import CompiledDFA, load_dfa_compact
+
+MAGIC  = b"LFADFA01"
+HEADER = struct.Struct("=7I")     # ordinea nativă, ca tablourile scrise cu tobytes()
+MARKER = 0x01020304
+
+
+def _pad4(n):
+    return -n % 4
+
+
+def save_bin(filepath: str, dfa: CompiledDFA):
+    """
+    Scrie DFA-ul compilat în format binar.
+    """
+    names = "\n".join([*dfa.states, *dfa.symbols]).encode("utf-8")
+    classes = array("i", [dfa.columns[sym] for sym in dfa.symbols])
+    nstates = len(dfa.states)
+
+    with open(filepath, "wb") as fh:
+        fh.write(MAGIC)
+        fh.write(HEADER.pack(MARKER, nstates, len(dfa.symbols), dfa.ncols,
+                             dfa.start, len(dfa.lut), len(names)))
+        fh.write(bytes(dfa.finals))
+        fh.write(bytes(dfa.dead))
+        fh.write(bytes(_pad4(2 * nstates)))
+        fh.write(array("i", dfa.table).tobytes())
+        fh.write(array("i", dfa.lut).tobytes())
+        fh.write(classes.tobytes())
+        fh.write(names)
+
+
+def is_binary(filepath: str):
+    """
+    True dacă fișierul începe cu antetul formatului binar.
+    """
+    with open(filepath, "rb") as fh:
+        return fh.read(len(MAGIC)) == MAGIC
+
+
+def load_bin(filepath: str):
+    """
+    Mapează fișierul binar în memorie și întoarce un CompiledDFA ale cărui
+    `finals`, `dead`, `table` și `lut` sunt vederi peste mmap (fără copiere).
+    """
+    with open(filepath, "rb") as fh:
+        mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if mm[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{filepath} nu este un DFA binar")
+    pos = len(MAGIC)
+    marker, nstates, nsymbols, ncols, start, lut_len, names_len = HEADER.unpack_from(mm, pos)
+    if marker != MARKER:
+        raise ValueError(f"{filepath} a fost scris pe o mașină cu altă ordine a octeților")
+    pos += HEADER.size
+
+    view = memoryview(mm)
+
+    def take(nbytes):
+        nonlocal pos
+        part = view[pos:pos + nbytes]
+        pos += nbytes
+        return part
+
+    finals = take(nstates)
+    dead   = take(nstates)
+    pos   += _pad4(2 * nstates)
+    table   = take(4 * nstates * ncols).cast("i")
+    lut     = take(4 * lut_len).cast("i")
+    classes = take(4 * nsymbols).cast("i")
+    names   = bytes(take(names_len)).decode("utf-8").split("\n") if names_len else []
+
+    states, symbols = names[:nstates], names[nstates:]
+    columns = dict(zip(symbols, classes))
+    return CompiledDFA(states, symbols, columns, ncols, start, finals, dead, table, lut)
+
+
+def compile_file(src: str, dst: str):
+    """
+    Compilează un fișier text .dfa în format binar.
+    """
+    dfa = load_dfa_compact(src)
+    save_bin(dst, dfa)
+    return dfa
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Utilizare: python dfa_bin.py <automat.dfa> <automat.dfab>")
+        sys.exit(1)
+
+    dfa = compile_file(sys.argv[1], sys.argv[2])
+    print(f"{len(dfa.states)} stări, {len(dfa.symbols)} simboluri, {dfa.ncols} clase -> {sys.argv[2]}")
@@ -0,0 +1,99 @@
+"""
+minimize.py  –  Minimizarea unui DFA cu algoritmul lui Hopcroft
+
+Lucrează direct pe componentele întoarse de dfa.load_dfa (Q, Σ, q0, F, δ)
+și întoarce un DFA echivalent, în aceeași formă, cu număr minim de stări.
+
+Pași:
+  1. se elimină stările inaccesibile din starea de start;
+  2. se pornește de la partiția {F, Q \\ F};
+  3. fiecare bloc scos din lista de lucru („splitter”) împarte blocurile ce
+     conțin atât stări care ajung în el pe un simbol, cât și stări care nu
+     ajung; în lista de lucru intră doar jumătatea mai mică (O(n·|Σ|·log n)).
+
+Fiecare bloc final devine o stare, numită după primul său membru din Q.
+"""
+
+
+def reachable_states(Σ, q0, δ):
+    """
+    Returnează mulțimea stărilor accesibile din q0 urmând tranziții δ.
+    """
+    seen  = {q0}
+    stack = [q0]
+    while stack:
+        q = stack.pop()
+        for sym in Σ:
+            nxt = δ[(q, sym)]
+            if nxt not in seen:
+                seen.add(nxt)
+                stack.append(nxt)
+    return seen
+
+
+def minimize_dfa(Q, Σ, q0, F, δ):
+    """
+    Întoarce (Q', Σ, q0', F', δ') – DFA-ul minimal echivalent cu cel dat.
+    DFA-ul de intrare trebuie să fie complet (așa cum îl garantează load_dfa).
+    """
+    alive = reachable_states(Σ, q0, δ)
+    order = [q for q in Q if q in alive]     # păstrăm ordinea din fișier
+
+    # δ inversat: inv[sym][dst] = lista stărilor care ajung în dst pe sym
+    inv = {sym: {} for sym in Σ}
+    for q in order:
+        for sym in Σ:
+            inv[sym].setdefault(δ[(q, sym)], []).append(q)
+
+    # Partiția inițială: stări finale / nefinale (doar blocurile nevide)
+    blocks   = [b for b in ({q for q in order if q in F},
+                            {q for q in order if q not in F}) if b]
+    block_of = {q: i for i, b in enumerate(blocks) for q in b}
+
+    # Lista de lucru: indici de blocuri, plus o mulțime pentru test rapid
+    work    = list(range(len(blocks)))
+    in_work = set(work)
+
+    while work:
+        splitter = work.pop()
+        in_work.discard(splitter)
+        members = list(blocks[splitter])
+
+        for sym in Σ:
+            # Stările care ajung în splitter pe `sym`, grupate pe blocuri
+            touched = {}
+            for dst in members:
+                for src in inv[sym].get(dst, ()):
+                    touched.setdefault(block_of[src], set()).add(src)
+
+            for bid, hit in touched.items():
+                block = blocks[bid]
+                if len(hit) == len(block):
+                    continue  # blocul nu se împarte
+
+                # Blocul se desparte în hit și block \ hit
+                block -= hit
+                new_id = len(blocks)
+                blocks.append(hit)
+                for q in hit:
+                    block_of[q] = new_id
+
+                if bid in in_work:
+                    work.append(new_id)
+                    in_work.add(new_id)
+                else:
+                    smaller = new_id if len(hit) <= len(block) else bid
+                    work.append(smaller)
+                    in_work.add(smaller)
+
+    # Reprezentantul fiecărui bloc: primul membru în ordinea din Q
+    rep = {}
+    for q in order:
+        rep.setdefault(block_of[q], q)
+
+    Q_min  = [q for q in order if rep[block_of[q]] == q]
+    F_min  = {q for q in Q_min if q in F}
+    δ_min  = {(q, sym): rep[block_of[δ[(q, sym)]]] for q in Q_min for sym in Σ}
+    q0_min = rep[block_of[q0]]
+
+    return Q_min, list(Σ), q0_min, F_min, δ_min
@@ -0,0 +1,143 @@
+"""
+multi.py  –  Mai multe DFA-uri rulate împreună, într-o singură trecere
+
+Fiecare cuvânt este citit o singură dată, iar la fiecare caracter toate
+automatele avansează simultan. Rezultatul pentru un cuvânt este lista
+indicilor automatelor care îl acceptă.
+
+Opțional, LazyProduct construiește leneș automatul produs: fiecare tuplu de
+stări întâlnit primește un identificator, iar tranzițiile lui sunt memorate,
+astfel încât tuplurile frecvente avansează printr-o singură căutare în
+dicționar. Componentele ajunse într-o stare capcană devin -1, ca tuplurile
+să se repete cât mai des.
+
+Utilizare:
+    python multi.py a.dfa b.dfa c.dfa --input cuvinte.txt [--product]
+"""
+
+import sys
+
+from dfa import compile_dfa, iter_records, load_dfa
+
+DEAD = -1   # componentă care a respins deja cuvântul
+
+
+def load_many(paths):
+    """
+    Încarcă și compilează fiecare fișier .dfa din `paths`.
+    """
+    return [compile_dfa(*load_dfa(p)) for p in paths]
+
+
+def _advance(dfas, states, ch):
+    """
+    Un pas al tuturor automatelor pe caracterul `ch`; întoarce noul tuplu.
+    """
+    nxt = []
+    for dfa, s in zip(dfas, states):
+        if s != DEAD:
+            c = dfa.columns.get(ch)
+            if c is None:
+                s = DEAD
+            else:
+                s = dfa.table[s * dfa.ncols + c]
+                if dfa.dead[s]:
+                    s = DEAD
+        nxt.append(s)
+    return tuple(nxt)
+
+
+def _accepting(dfas, states):
+    return tuple(i for i, (dfa, s) in enumerate(zip(dfas, states))
+                 if s != DEAD and dfa.finals[s])
+
+
+def _initial(dfas):
+    return tuple(DEAD if d.dead[d.start] else d.start for d in dfas)
+
+
+def run_all(word, dfas):
+    """
+    Parcurge `word` o singură dată cu toate automatele din `dfas`
+    și întoarce tuplul indicilor celor care acceptă.
+    """
+    states = _initial(dfas)
+    for ch in word:
+        states = _advance(dfas, states, ch)
+    return _accepting(dfas, states)
+
+
+class LazyProduct:
+    """
+    Automat produs construit la cerere. Cel mult `max_states` tupluri sunt
+    internate; după atingerea limitei, cuvintele care ies din partea deja
+    construită continuă cu pași pe componente (ca run_all).
+    """
+
+    __slots__ = ("dfas", "ids", "tuples", "trans", "accepting", "max_states")
+
+    def __init__(self, dfas, max_states=100_000):
+        self.dfas       = dfas
+        self.ids        = {}    # tuplu de stări -> id
+        self.tuples     = []    # id -> tuplu de stări
+        self.trans      = []    # id -> {caracter: id următor}
+        self.accepting  = []    # id -> tuplul automatelor care acceptă
+        self.max_states = max_states
+        self._intern(_initial(dfas))
+
+    def _intern(self, states):
+        pid = self.ids.get(states)
+        if pid is None:
+            if len(self.tuples) >= self.max_states:
+                return None
+            pid = len(self.tuples)
+            self.ids[states] = pid
+            self.tuples.append(states)
+            self.trans.append({})
+            self.accepting.append(_accepting(self.dfas, states))
+        return pid
+
+    def run(self, word):
+        """
+        Ca run_all, dar prin automatul produs.
+        """
+        trans = self.trans
+        pid = 0
+        for i, ch in enumerate(word):
+            nxt = trans[pid].get(ch)
+            if nxt is None:
+                states = _advance(self.dfas, self.tuples[pid], ch)
+                nxt = self._intern(states)
+                if nxt is None:
+                    # Tabelul e plin: restul cuvântului se face pe componente
+                    for rest in word[i + 1:]:
+                        states = _advance(self.dfas, states, rest)
+                    return _accepting(self.dfas, states)
+                trans[pid][ch] = nxt
+            pid = nxt
+        return self.accepting[pid]
+
+    def __len__(self):
+        return len(self.tuples)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Rulează mai multe DFA-uri într-o singură trecere")
+    parser.add_argument("automate", nargs="+", help="fișierele .dfa")
+    parser.add_argument("--input", metavar="FIȘIER", default="-",
+                        help="o înregistrare pe linie („-” = stdin, implicit)")
+    parser.add_argument("--product", action="store_true",
+                        help="folosește automatul produs construit leneș")
+    args = parser.parse_args()
+
+    dfas  = load_many(args.automate)
+    names = [p.encode("utf-8") for p in args.automate]
+    run   = LazyProduct(dfas).run if args.product else (lambda w: run_all(w, dfas))
+
+    # Pentru fiecare înregistrare se scrie o linie cu automatele care o acceptă
+    out = sys.stdout.buffer
+    for words in iter_records(args.input):
+        out.write(b"".join(b",".join(names[i] for i in run(w)) + b"\n" for w in words))
+    out.flush()
@@ -1,40 +1,34 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))   # rădăcina repo-ului
+import lfa_parser
+
 FPATH = __file__.rsplit("/", maxsplit=1)[0] + "/"
-def load_automata(filename):
+
+# Regulile jocului din joc_greu.lfa, folosite și de solver.py:
+ITEMS  = {"kitchen": "spoon"}       # camera -> obiectul care poate fi luat acolo
+LOCKS  = {"mega_exit": "spoon"}     # camera -> obiectul necesar pentru a intra
+GOALS  = ("exit", "mega_exit")      # camerele în care jocul se termină
+LABELS = {"spoon": "lingura"}       # numele obiectelor afișate jucătorului
+
+def load_automata(filename, verbose=True):
     """
     Încarcă automata din fișierul indicat.
     Fișierul trebuie să conțină trei secțiuni: [States], [Symbols] și [Rules],
     fiecare separat de o linie cu un singur caracter '#'.
+    Cu verbose=False nu se mai afișează conținutul (util pentru hărți mari).
     """
-    states = []
-    symbols = []
-    rules = []
-    
-    with open(FPATH + filename, "r") as f:
-        content = f.read().strip()
-    
-    # Împarte conținutul fișierului în secțiuni după separatorul '#'
-    sections = content.split("#")
-    
-    for section in sections:
-        # Obține fiecare linie ne-gol, curățată de spații, din secțiune
-        lines = [line.strip() for line in section.strip().split("\n") if line.strip()]
-        if not lines:
-            continue
-        header = lines[0]
-        if header == "[States]":
-            states = lines[1:]  # Fiecare linie după antet este o stare
-        elif header == "[Symbols]":
-            symbols = lines[1:]
-        elif header == "[Rules]":
-            for line in lines[1:]:
-                # Presupune că fiecare regulă are formatul: stare_curentă simbol stare_următoare
-                parts = line.split()
-                if len(parts) == 3:
-                    rules.append((parts[0], parts[1], parts[2]))
-    
-    print("States:", states)
-    print("Symbols:", symbols)
-    print("Rules:", rules)
+    sections = lfa_parser.parse(FPATH + filename)   # parserul comun, cu cache pe disc
+    states  = lfa_parser.joined(sections.get("States", ()))
+    symbols = lfa_parser.joined(sections.get("Symbols", ()))
+    # Fiecare regulă are formatul: stare_curentă simbol stare_următoare
+    rules   = [rule for rule in sections.get("Rules", ()) if len(rule) == 3]
+
+    if verbose:
+        print("States:", states)
+        print("Symbols:", symbols)
+        print("Rules:", rules)
     return states, symbols, rules
 
 
@@ -48,10 +42,23 @@ def build_transitions(rules):
     return transitions
 
 
+def build_adjacency(transitions):
+    """
+    Indexul mișcărilor: stare -> listă de (mișcare, stare_următoare), în
+    ordinea regulilor. Se construiește o singură dată, ca mișcările
+    disponibile dintr-o cameră să nu mai ceară parcurgerea tuturor tranzițiilor.
+    """
+    adjacency = {}
+    for (state, move), next_state in transitions.items():
+        adjacency.setdefault(state, []).append((move, next_state))
+    return adjacency
+
+
 def main():
     filename = "joc.lfa"
     states, symbols, rules = load_automata(filename)
     transitions = build_transitions(rules)
+    adjacency = build_adjacency(transitions)
     
     # Începe jocul din starea "entrance".
     current_state = "entrance"
@@ -66,7 +73,7 @@ def main():
             break
         
         # Determină mișcările disponibile din camera curentă.
-        available_moves = [move for (state, move) in transitions if state == current_state]
+        available_moves = [move for move, _ in adjacency.get(current_state, ())]
         if available_moves:
             print("Poți să mergi:", ", ".join(available_moves))
         else:
@@ -92,6 +99,7 @@ def run_game():
     filename = "joc_greu.lfa"
     states, symbols, rules = load_automata(filename)
     transitions = build_transitions(rules)
+    adjacency = build_adjacency(transitions)
     
     # Jocul începe în camera "entrance".
     current_state = "entrance"
@@ -113,21 +121,23 @@ def run_game():
             break
         
         # Listează mișcările disponibile conform regulilor automatelor.
-        available_moves = [move for (state, move) in transitions if state == current_state]
+        available_moves = [move for move, _ in adjacency.get(current_state, ())]
         
-        if current_state == "kitchen" and "spoon" not in inventory:
+        item = ITEMS.get(current_state)
+        if item is not None and item not in inventory:
             available_moves.append("pick")
         
         print("Poți:", ", ".join(available_moves))
         command = input("Introdu comanda: ").strip().lower()
         
         if command == "pick":
-            if current_state == "kitchen":
-                if "spoon" in inventory:
-                    print("Ai luat deja lingura.")
+            if item is not None:
+                label = LABELS.get(item, item)
+                if item in inventory:
+                    print(f"Ai luat deja {label}.")
                 else:
-                    inventory.add("spoon")
-                    print("Ai luat lingura!")
+                    inventory.add(item)
+                    print(f"Ai luat {label}!")
             else:
                 print("Nu este nimic de luat aici.")
             continue
@@ -140,8 +150,9 @@ def run_game():
         key = (current_state, command)
         if key in transitions:
             next_state = transitions[key]
-            if next_state == "mega_exit" and "spoon" not in inventory:
-                print("Ai nevoie de lingură pentru a intra în mega_exit!")
+            needed = LOCKS.get(next_state)
+            if needed is not None and needed not in inventory:
+                print(f"Ai nevoie de {LABELS.get(needed, needed)} pentru a intra în {next_state}!")
                 continue
             current_state = next_state
         else:
@@ -0,0 +1,89 @@
+"""
+loadgen.py  –  Generator de încărcare local pentru server.py
+
+Deschide `--sessions` sesiuni, câte cel mult `--concurrency` simultan. Fiecare
+sesiune face o plimbare aleatoare de cel mult `--commands` comenzi (alege una
+dintre mișcările anunțate în linia ROOM, sau „pick” când e disponibil), apoi
+trimite „quit”. La final se afișează sesiunile pe secundă și latența
+comenzilor (mediană, p99, maximă).
+
+Utilizare:
+    python loadgen.py [--host 127.0.0.1] [--port 8765] [--sessions 10000]
+                      [--concurrency 500] [--commands 20]
+"""
+
+import asyncio
+import random
+import time
+
+
+def room_moves(line):
+    """Mișcările din linia „ROOM <cameră> <mișcări>”; ValueError pentru altceva."""
+    parts = line.split()
+    if len(parts) != 3 or parts[0] != "ROOM":
+        raise ValueError(f"răspuns neașteptat de la server: {line!r}")
+    return parts[2].split(",")
+
+
+async def session(host, port, commands, latencies, rng):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        moves = room_moves((await reader.readline()).decode())
+        for _ in range(commands):
+            command = rng.choice(moves) if moves != ["-"] else "look"
+            t0 = time.perf_counter()
+            writer.write(command.encode() + b"\n")
+            line = (await reader.readline()).decode()
+            latencies.append(time.perf_counter() - t0)
+            if not line:
+                raise ConnectionError("serverul a închis conexiunea")
+            if line.startswith("WIN"):
+                return
+            if line.startswith("ROOM"):
+                moves = room_moves(line)
+        writer.write(b"quit\n")
+        await reader.readline()
+    finally:
+        writer.close()
+
+
+async def main(host, port, sessions, concurrency, commands, seed):
+    rng = random.Random(seed)
+    latencies = []
+    failures = 0
+    limit = asyncio.Semaphore(concurrency)
+
+    async def one():
+        nonlocal failures
+        async with limit:
+            try:
+                await session(host, port, commands, latencies, rng)
+            except (OSError, ValueError):     # ConnectionError e un OSError
+                failures += 1
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(sessions)))
+    elapsed = time.perf_counter() - t0
+
+    latencies.sort()
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000 if latencies else 0.0
+    print(f"{sessions} sesiuni ({failures} eșuate) în {elapsed:.2f}s: "
+          f"{sessions / elapsed:.0f} sesiuni/s, {len(latencies) / elapsed:.0f} comenzi/s")
+    print(f"latență: mediană {pct(0.5):.2f} ms, p99 {pct(0.99):.2f} ms, max {pct(1.0):.2f} ms")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generator de încărcare pentru server.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--commands", type=int, default=20, help="comenzi pe sesiune")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.host, args.port, args.sessions, args.concurrency,
+                     args.commands, args.seed))
@@ -0,0 +1,163 @@
+"""
+server.py  –  Server asyncio pentru jocul din l2.py, cu multe sesiuni simultane
+
+Harta este încărcată și indexată o singură dată (solver.index_map) și este
+folosită doar pentru citire de toate sesiunile. O sesiune ține minte doar
+camera curentă (un întreg), inventarul (o mască de biți) și dacă s-a terminat.
+
+Protocol (o comandă pe linie, un răspuns pe linie, UTF-8):
+
+    look                        -> ROOM <cameră> <mișcări separate prin virgulă>
+    up | down | left | right    -> ROOM ...  sau  ERR no-exit  /  ERR locked <obiect>
+                                   sau, într-o cameră finală, WIN <cameră> (conexiunea se închide)
+    pick                        -> GOT <obiect>  sau  ERR nothing
+    quit                        -> BYE (conexiunea se închide)
+
+La conectare serverul trimite direct linia ROOM pentru camera de start.
+
+Utilizare:
+    python server.py [--map joc_greu.lfa] [--host 127.0.0.1] [--port 8765]
+"""
+
+import asyncio
+
+from l2 import GOALS, ITEMS, LOCKS, load_automata
+from solver import index_map
+
+
+class GameMap:
+    """
+    Harta partajată: indexul CSR plus măștile de obiecte și liniile ROOM
+    precalculate pentru fiecare cameră (cu și fără „pick”).
+    """
+
+    __slots__ = ("index", "start", "bits", "item_bit", "lock_bit", "is_goal",
+                 "move_ids", "room_lines")
+
+    def __init__(self, filename, start="entrance", goals=GOALS, items=ITEMS, locks=LOCKS):
+        states, symbols, rules = load_automata(filename, verbose=False)
+        index = self.index = index_map(states, rules)
+        n = len(index.rooms)
+        self.start = index.ids[start]
+        names = sorted(set(items.values()) | set(locks.values()))
+        self.bits = {name: 1 << i for i, name in enumerate(names)}
+        self.item_bit = [0] * n
+        self.lock_bit = [0] * n
+        for room, name in items.items():
+            if room in index.ids:
+                self.item_bit[index.ids[room]] = self.bits[name]
+        for room, name in locks.items():
+            if room in index.ids:
+                self.lock_bit[index.ids[room]] = self.bits[name]
+        self.is_goal = bytearray(n)
+        for room in goals:
+            if room in index.ids:
+                self.is_goal[index.ids[room]] = 1
+        self.move_ids = {move: i for i, move in enumerate(index.moves)}
+
+        self.room_lines = []            # cameră -> (linie fără pick, linie cu pick)
+        for r, room in enumerate(index.rooms):
+            moves = [index.moves[index.labels[j]]
+                     for j in range(index.offsets[r], index.offsets[r + 1])]
+            line = f"ROOM {room} {','.join(moves) or '-'}\n".encode()
+            with_pick = f"ROOM {room} {','.join([*moves, 'pick'])}\n".encode()
+            self.room_lines.append((line, with_pick))
+
+    def item_name(self, bit):
+        return next(name for name, b in self.bits.items() if b == bit)
+
+    def target(self, room, move):
+        """Camera în care duce `move` din `room`, sau -1."""
+        label = self.move_ids.get(move)
+        index = self.index
+        for j in range(index.offsets[room], index.offsets[room + 1]):
+            if index.labels[j] == label:
+                return index.targets[j]
+        return -1
+
+
+class Session:
+    """
+    Starea unui jucător: camera curentă, inventarul (mască de biți), sfârșit.
+    """
+
+    __slots__ = ("room", "inventory", "done")
+
+    def __init__(self, room):
+        self.room = room
+        self.inventory = 0
+        self.done = False
+
+
+def room_line(game, s):
+    b = game.item_bit[s.room]
+    return game.room_lines[s.room][1 if b and not s.inventory & b else 0]
+
+
+def handle(game, s, command):
+    """
+    Execută o comandă și întoarce răspunsul (bytes, cu '\\n' la final).
+    """
+    if command == "look":
+        return room_line(game, s)
+    if command == "quit":
+        s.done = True
+        return b"BYE\n"
+    if command == "pick":
+        b = game.item_bit[s.room]
+        if not b or s.inventory & b:
+            return b"ERR nothing\n"
+        s.inventory |= b
+        return f"GOT {game.item_name(b)}\n".encode()
+    if command not in game.move_ids:
+        return b"ERR unknown-command\n"
+
+    t = game.target(s.room, command)
+    if t < 0:
+        return b"ERR no-exit\n"
+    need = game.lock_bit[t]
+    if need and not s.inventory & need:
+        return f"ERR locked {game.item_name(need)}\n".encode()
+    s.room = t
+    if game.is_goal[t]:
+        s.done = True
+        return f"WIN {game.index.rooms[t]}\n".encode()
+    return room_line(game, s)
+
+
+async def serve(game, host, port):
+    async def client(reader, writer):
+        s = Session(game.start)
+        try:
+            writer.write(room_line(game, s))
+            while not s.done:
+                raw = await reader.readline()
+                if not raw:
+                    break
+                writer.write(handle(game, s, raw.decode("utf-8", "replace").strip().lower()))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(client, host, port, backlog=4096)
+    addrs = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+    print(f"Server pornit pe {addrs} ({len(game.index.rooms)} camere)")
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Server asyncio pentru jocul bazat pe automat")
+    parser.add_argument("--map", default="joc_greu.lfa", help="harta (implicit joc_greu.lfa)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(GameMap(args.map), args.host, args.port))
+    except KeyboardInterrupt:
+        print("Server oprit.")
@@ -0,0 +1,239 @@
+"""
+solver.py  –  Rezolvarea hărților jocului, inclusiv a celor foarte mari
+
+Căutarea în lățime se face în produsul camere × inventar: un nod este
+(cameră, mască de biți a obiectelor deținute). Din fiecare nod se poate
+  - lua obiectul din cameră ("pick"), dacă există și nu e deja în inventar;
+  - merge pe orice mișcare a camerei, cu excepția camerelor încuiate
+    (LOCKS) pentru care lipsește obiectul necesar.
+Camerele din GOALS termină jocul, deci nu sunt extinse mai departe.
+
+Rezultatul: cea mai scurtă secvență de comenzi până la o cameră finală și
+mulțimea camerelor accesibile din camera de start. Harta este indexată în
+tablouri de întregi (format CSR), ca să încapă și hărți cu milioane de camere.
+
+Rezultatele sunt păstrate în __solvercache__/, lângă hartă, sub o cheie
+formată din hash-ul sha256 al conținutului hărții, din parametrii căutării
+și din VERSION. Fișierele sunt scrise cu marshal (doar tupluri, liste și
+șiruri), ca în lfa_parser: un cache pus lângă o hartă străină nu poate
+executa cod la încărcare.
+
+Utilizare:
+    python solver.py joc_greu.lfa [--start entrance] [--rooms] [--no-cache]
+"""
+
+import hashlib
+import marshal
+import os
+from array import array
+from collections import deque
+from pathlib import Path
+from typing import NamedTuple
+
+from l2 import FPATH, GOALS, ITEMS, LOCKS, build_transitions, load_automata
+
+VERSION   = "2"                 # se schimbă când se schimbă solve sau Solution
+CACHE_DIR = "__solvercache__"
+PICK      = "pick"
+
+
+class MapIndex(NamedTuple):
+    """
+    Harta cu camere numerotate; mișcările camerei r sunt
+    (moves[labels[j]], targets[j]) pentru j în offsets[r] .. offsets[r + 1] - 1.
+    """
+    rooms: list       # id -> numele camerei
+    ids: dict         # numele camerei -> id
+    moves: list       # id mișcare -> numele mișcării
+    offsets: array
+    targets: array
+    labels: array
+
+
+class Solution(NamedTuple):
+    path: list        # cea mai scurtă secvență de comenzi (None dacă nu se poate câștiga)
+    goal: str         # camera finală atinsă (None dacă nu se poate câștiga)
+    reachable: frozenset   # camerele accesibile din start
+    explored: int     # noduri (cameră, inventar) vizitate
+
+
+def index_map(states, rules):
+    """
+    Construiește MapIndex din rezultatul lui load_automata.
+    """
+    transitions = build_transitions(rules)
+    rooms = list(dict.fromkeys([*states, *(s for s, _ in transitions), *transitions.values()]))
+    ids   = {room: i for i, room in enumerate(rooms)}
+    moves = sorted({move for _, move in transitions})
+    move_ids = {move: i for i, move in enumerate(moves)}
+
+    # Sortare prin numărare după camera sursă: două treceri, fără sort pe tupluri.
+    srcs = [ids[s] for s, _ in transitions]
+    offsets = array("i", [0] * (len(rooms) + 1))
+    for src in srcs:
+        offsets[src + 1] += 1
+    for r in range(len(rooms)):
+        offsets[r + 1] += offsets[r]
+    fill    = offsets[:-1]
+    targets = array("i", bytes(4 * len(srcs)))
+    labels  = array("i", bytes(4 * len(srcs)))
+    for src, ((_, move), dst) in zip(srcs, transitions.items()):
+        j = fill[src]
+        fill[src] = j + 1
+        targets[j] = ids[dst]
+        labels[j] = move_ids[move]
+    return MapIndex(rooms, ids, moves, offsets, targets, labels)
+
+
+def solve(index: MapIndex, start="entrance", goals=GOALS, items=ITEMS, locks=LOCKS):
+    """
+    BFS în produsul camere × inventar; întoarce o Solution.
+    """
+    names = sorted(set(items.values()) | set(locks.values()))
+    bit   = {name: 1 << i for i, name in enumerate(names)}
+    k     = len(names)
+    n     = len(index.rooms)
+    pick_id = len(index.moves)
+
+    item_bit = array("i", [0] * n)
+    lock_bit = array("i", [0] * n)
+    for room, name in items.items():
+        if room in index.ids:
+            item_bit[index.ids[room]] = bit[name]
+    for room, name in locks.items():
+        if room in index.ids:
+            lock_bit[index.ids[room]] = bit[name]
+    is_goal = bytearray(n)
+    for room in goals:
+        if room in index.ids:
+            is_goal[index.ids[room]] = 1
+
+    offsets, targets, labels = index.offsets, index.targets, index.labels
+    parent = array("i", [-1]) * (n << k)      # nod -> nodul din care a fost atins
+    action = array("i", [-1]) * (n << k)      # nod -> mișcarea folosită (pick_id = "pick")
+    seen   = bytearray(n << k)
+    in_room = bytearray(n)
+
+    if start not in index.ids:
+        raise ValueError(f"Camera de start necunoscută: {start}")
+    s = index.ids[start]
+    seen[s << k] = 1
+    queue = deque([s << k])
+    found = None
+    explored = 0
+
+    mask_all = (1 << k) - 1
+    while queue:
+        node = queue.popleft()
+        explored += 1
+        room, mask = node >> k, node & mask_all
+        in_room[room] = 1
+        if is_goal[room]:
+            if found is None:
+                found = node
+            continue
+        b = item_bit[room]
+        if b and not mask & b:
+            nxt = node | b
+            if not seen[nxt]:
+                seen[nxt] = 1
+                parent[nxt] = node
+                action[nxt] = pick_id
+                queue.append(nxt)
+        for j in range(offsets[room], offsets[room + 1]):
+            t = targets[j]
+            need = lock_bit[t]
+            if need and not mask & need:
+                continue
+            nxt = (t << k) | mask
+            if not seen[nxt]:
+                seen[nxt] = 1
+                parent[nxt] = node
+                action[nxt] = labels[j]
+                queue.append(nxt)
+
+    path = goal = None
+    if found is not None:
+        goal = index.rooms[found >> k]
+        path = []
+        node = found
+        while parent[node] != -1:
+            act = action[node]
+            path.append(PICK if act == pick_id else index.moves[act])
+            node = parent[node]
+        path.reverse()
+    reachable = frozenset(index.rooms[r] for r in range(n) if in_room[r])
+    return Solution(path, goal, reachable, explored)
+
+
+def _load_cache(cached, key):
+    """Solution din cache, sau None dacă fișierul lipsește, e stricat ori e pentru altă cheie."""
+    try:
+        with open(cached, "rb") as fh:
+            entry = marshal.load(fh)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if type(entry) is not tuple or len(entry) != 5 or entry[0] != key:
+        return None
+    _, path, goal, reachable, explored = entry
+    if (path is not None and type(path) is not list) or type(reachable) is not frozenset \
+            or type(explored) is not int:
+        return None
+    return Solution(path, goal, reachable, explored)
+
+
+def _store_cache(cached, key, result):
+    try:
+        cached.parent.mkdir(exist_ok=True)
+        tmp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as fh:
+            marshal.dump((key, *result), fh)
+        tmp.replace(cached)            # atomic: alte procese văd fișierul complet
+    except OSError:
+        pass                           # fără cache (de ex. director read-only)
+
+
+def solve_file(filename, start="entrance", goals=GOALS, items=ITEMS, locks=LOCKS, cache=True):
+    """
+    Ca solve, pentru harta din fișierul `filename` (relativ la FPATH),
+    cu rezultatul păstrat pe disc pentru rulările următoare.
+    """
+    path = Path(FPATH + filename)
+    params = repr((VERSION, start, tuple(goals), sorted(items.items()), sorted(locks.items())))
+    key = hashlib.sha256(path.read_bytes() + b"\0" + params.encode()).hexdigest()
+    cached = path.parent / CACHE_DIR / f"{path.name}.{key[:32]}.marshal"
+
+    if cache and cached.exists():
+        result = _load_cache(cached, key)
+        if result is not None:
+            return result
+
+    states, symbols, rules = load_automata(filename, verbose=False)
+    result = solve(index_map(states, rules), start, goals, items, locks)
+
+    if cache:
+        _store_cache(cached, key, result)
+    return result
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Cel mai scurt drum spre ieșire și camerele accesibile")
+    parser.add_argument("harta", help="fișierul .lfa (relativ la directorul scriptului)")
+    parser.add_argument("--start", default="entrance", help="camera de start (implicit entrance)")
+    parser.add_argument("--rooms", action="store_true", help="afișează camerele accesibile")
+    parser.add_argument("--no-cache", action="store_true", help="nu folosi cache-ul de pe disc")
+    args = parser.parse_args()
+
+    try:
+        sol = solve_file(args.harta, start=args.start, cache=not args.no_cache)
+    except ValueError as e:
+        parser.error(str(e))
+    if sol.path is None:
+        print("Nu există drum câștigător.")
+    else:
+        print(f"Drum câștigător spre {sol.goal} ({len(sol.path)} comenzi): {' '.join(sol.path)}")
+    print(f"Camere accesibile: {len(sol.reachable)}, noduri explorate: {sol.explored}")
+    if args.rooms:
+        print(", ".join(sorted(sol.reachable)))
@@ -1,4 +1,13 @@
+import os
+import sys
+from array import array
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))   #radacina repo-ului
+import lfa_parser
+
 FPATH = __file__.rsplit("/", maxsplit=1)[0] + "/"
+CHUNK = 1 << 16  #cate randuri se scriu / se convertesc odata in functiile pe bucati
 def save_matrix(n):
     matrice=[[int(x) for x in input().split()] for _ in range(n)] #citesc din input matricea
     return matrice #o returnez
@@ -15,52 +24,145 @@ def load_matrix(fisier, matrice):
     
     g.close() #inchid fisierul
 
+
+def _numpy():
+    #numpy e optional si se importa doar cand e nevoie de fisiere .npy
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Pentru fisierele .npy este nevoie de numpy (pip install numpy)") from None
+    return numpy
+
+
+def save_matrix_npy(fisier, matrice, dtype="int64"):
+    #scrie matricea in format .npy; fisierul e creat ca memmap, deci se scrie
+    #rand cu rand si matricea (lista de liste) nu e copiata inca o data in memorie
+    np = _numpy()
+    nr_coloane = len(matrice[0]) if matrice else 0
+    if any(len(line) != nr_coloane for line in matrice):
+        raise ValueError("NU E MATRICE")
+    out = np.lib.format.open_memmap(FPATH+fisier, mode="w+", dtype=dtype,
+                                    shape=(len(matrice), nr_coloane))
+    for i, line in enumerate(matrice):
+        out[i] = line
+    out.flush()
+    del out
+
+
+def load_matrix_npy(fisier, mmap=True):
+    #citeste o matrice .npy; cu mmap=True datele raman pe disc si sunt citite
+    #doar cand sunt accesate, deci merge si pentru matrici mai mari decat RAM-ul
+    np = _numpy()
+    return np.load(FPATH+fisier, mmap_mode="r" if mmap else None)
+
+
+def write_matrix_stream(fisier, randuri, chunk=CHUNK):
+    #varianta pe bucati a lui load_matrix: `randuri` poate fi orice iterabil
+    #(si un generator), e parcurs o singura data si verificat din mers.
+    #Se scrie intr-un fisier temporar, iar la final acesta inlocuieste fisierul
+    #cerut; daca randurile nu au aceeasi lungime, in fisier apare "NU E MATRICE".
+    cale = FPATH+fisier
+    tmp = cale + ".tmp"
+    nr_coloane = None
+    ok = True
+    with open(tmp, "w") as g:
+        bucata = []
+        for line in randuri:
+            if nr_coloane is None:
+                nr_coloane = len(line)
+            elif len(line) != nr_coloane:
+                ok = False
+                break
+            bucata.append(" ".join(map(str, line)))
+            if len(bucata) >= chunk:
+                g.write("\n".join(bucata) + "\n")
+                bucata = []
+        if ok and bucata:
+            g.write("\n".join(bucata) + "\n")
+    if not ok:
+        with open(tmp, "w") as g:
+            g.write("NU E MATRICE\n")
+    os.replace(tmp, cale)
+    return ok
+
+
+def read_matrix_stream(fisier, chunk=CHUNK):
+    #citeste un fisier scris de load_matrix / write_matrix_stream bucata cu bucata:
+    #produce liste de cel mult `chunk` randuri (liste de int) si verifica din mers
+    #ca toate randurile au acelasi numar de coloane (altfel ValueError)
+    nr_coloane = None
+    with open(FPATH+fisier) as f:
+        bucata = []
+        for nr, raw in enumerate(f, 1):
+            if not raw.strip():
+                continue
+            if raw.strip() == "NU E MATRICE":
+                raise ValueError(f"{fisier}: NU E MATRICE")
+            line = [int(x) for x in raw.split()]
+            if nr_coloane is None:
+                nr_coloane = len(line)
+            elif len(line) != nr_coloane:
+                raise ValueError(f"{fisier}, linia {nr}: {len(line)} coloane in loc de {nr_coloane}")
+            bucata.append(line)
+            if len(bucata) >= chunk:
+                yield bucata
+                bucata = []
+        if bucata:
+            yield bucata
+
+
+def text_to_npy(sursa, destinatie, chunk=CHUNK):
+    #converteste o matrice text in .npy fara sa o tina in memorie: randurile
+    #sunt adunate intr-un array('q') de cel mult `chunk` randuri si scrise intr-un
+    #fisier binar temporar; la final se scrie antetul .npy si se copiaza datele
+    np = _numpy()
+    cale = FPATH+destinatie
+    raw_path = cale + ".raw"
+    tmp_path = cale + ".tmp"
+    nr_randuri = nr_coloane = 0
+    try:
+        with open(raw_path, "wb") as raw:
+            for bucata in read_matrix_stream(sursa, chunk):
+                valori = array("q")
+                for line in bucata:
+                    valori.extend(line)
+                valori.tofile(raw)  #ordinea nativa a octetilor
+                nr_randuri += len(bucata)
+                nr_coloane = len(bucata[0])
+        #descr vine din dtype-ul nativ "q", deci antetul spune aceeasi ordine a
+        #octetilor in care a scris array.tofile
+        header = {"descr": np.lib.format.dtype_to_descr(np.dtype("q")),
+                  "fortran_order": False, "shape": (nr_randuri, nr_coloane)}
+        with open(tmp_path, "wb") as out, open(raw_path, "rb") as raw:
+            np.lib.format.write_array_header_1_0(out, header)
+            while True:
+                date = raw.read(1 << 20)
+                if not date:
+                    break
+                out.write(date)
+        os.replace(tmp_path, cale)
+    finally:
+        #fisierele temporare nu raman pe disc nici daca matricea e respinsa
+        for temp in (raw_path, tmp_path):
+            if os.path.exists(temp):
+                os.remove(temp)
+    return nr_randuri, nr_coloane
+
+
 def load_automata(fisier):
-    rules=[]
-    states=[]
-    symbols=[]
-    with open(FPATH+fisier,"r+") as f:
-         lines=f.read().strip()
-    sections=lines.split("#")
-    for section in sections:
-        paragraph=section.strip().split("\n")
-        """
-        try:
-            l=[]
-            dict=[]
-            print(paragraph[1])
-            if paragraph[1]=="[States]":
-                for i in range(2,len(paragraph)):
-                    l.append(i)
-                states=" ".join(l)
-            elif paragraph[1]=="[Symbols]":
-                for i in range(2,len(paragraph)):
-                    l.append(i)
-                symbols=" ".join(l)
-            elif paragraph[1]=="Rules":
-                l1=[]
-                for i in range(2,len(paragraph)):   
-                    l1.append(i)
-                rules="".join(l1)
-        except:
-            continue
-        """
-        if len(paragraph) < 2:
-            continue  #evitam sectiuni goale
-
-        header = paragraph[0].strip()  #Prima linie a sectiunii
-
-        if header == "[States]":
-            states = [line.strip() for line in paragraph[1:] if line.strip()]
-        elif header == "[Symbols]":
-            symbols = [line.strip() for line in paragraph[1:] if line.strip()]
-        elif header == "[Rules]":
-            rules = [[int(num) for num in line.split()] for line in paragraph[1:] if line.strip()]
-    
+    #parsarea (cu cache pe disc) e facuta de lfa_parser, comun tuturor laboratoarelor
+    sectiuni = lfa_parser.parse(FPATH+fisier)
+    states = lfa_parser.joined(sectiuni.get("States", ()))
+    symbols = lfa_parser.joined(sectiuni.get("Symbols", ()))
+    rules = [[int(num) for num in line] for line in sectiuni.get("Rules", ())]
+
     print("States:", states)
     print("Symbols:", symbols)
     print("Rules:", rules)
-load_automata("text.txt")
+
+
+if __name__ == "__main__":
+    load_automata("text.txt")
 
 """
 n=int(input())
@@ -0,0 +1,105 @@
+"""
+determinize.py  –  Transformarea unui NFA (cu λ-tranziții) într-un DFA complet
+
+Construcția submulțimilor: fiecare stare a DFA-ului este o mulțime de stări
+ale NFA-ului, închisă la λ-tranziții. Mulțimea vidă devine o stare capcană
+explicită („sink”), astfel încât DFA-ul are tranziții pentru orice
+(stare, simbol) și poate fi încărcat cu DFA/dfa/dfa.py::load_dfa.
+
+Pentru a nu epuiza memoria la o explozie a numărului de stări, construcția
+se oprește cu RuntimeError după `max_states` stări.
+
+Utilizare:
+    python determinize.py automat.nfa automat.dfa [--max-states N]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+from nfa import epsilon_closure, load_nfa, move
+
+sys.path.append(str(Path(__file__).resolve().parents[2] / "DFA" / "dfa"))
+from dfa import save_dfa          # scrierea .dfa este cea din laboratorul DFA
+
+SINK = "sink"
+
+
+def determinize(Q, Σ, q0, F, δ, *, max_states=100_000, progress=None, progress_every=10_000):
+    """
+    Întoarce (Q_d, Σ_d, q0_d, F_d, δ_d, stats), unde primele cinci componente
+    au forma întoarsă de load_dfa, iar `stats` este un dicționar cu mărimile
+    rezultatului. `progress(n, pending)` este apelată la fiecare
+    `progress_every` stări noi, dacă e dată.
+    """
+    t0      = time.perf_counter()
+    symbols = sorted(Σ)
+
+    start = frozenset(epsilon_closure({q0}, δ))
+    names = {start: "d0"}        # mulțime de stări NFA -> numele stării DFA
+    queue = [start]
+    δ_d   = {}
+
+    def name_of(subset):
+        if subset in names:
+            return names[subset]
+        if len(names) >= max_states:
+            raise RuntimeError(
+                f"Determinizarea depășește limita de {max_states} stări "
+                f"(NFA cu {len(Q)} stări); măriți --max-states sau simplificați automatul"
+            )
+        names[subset] = SINK if not subset else f"d{len(names)}"
+        queue.append(subset)
+        if progress is not None and len(names) % progress_every == 0:
+            progress(len(names), len(queue) - done)
+        return names[subset]
+
+    done = 0
+    while done < len(queue):
+        subset = queue[done]
+        done += 1
+        src = names[subset]
+        for sym in symbols:
+            δ_d[(src, sym)] = name_of(frozenset(epsilon_closure(move(subset, sym, δ), δ)))
+
+    Q_d = [names[s] for s in queue]
+    F_d = {names[s] for s in queue if not F.isdisjoint(s)}
+
+    stats = {
+        "nfa_states":  len(Q),
+        "dfa_states":  len(Q_d),
+        "final":       len(F_d),
+        "transitions": len(δ_d),
+        "sink":        frozenset() in names,
+        "seconds":     time.perf_counter() - t0,
+    }
+    return Q_d, symbols, "d0", F_d, δ_d, stats
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Determinizează un NFA și scrie un fișier .dfa")
+    parser.add_argument("nfa", help="fișierul .nfa de intrare")
+    parser.add_argument("dfa", help="fișierul .dfa de ieșire")
+    parser.add_argument("--max-states", type=int, default=100_000,
+                        help="numărul maxim de stări DFA (implicit 100000)")
+    args = parser.parse_args()
+
+    Q, Σ, q0, F, δ = load_nfa(args.nfa)
+
+    def report(n, pending):
+        print(f"  ... {n} stări DFA, {pending} în așteptare", file=sys.stderr)
+
+    try:
+        Q_d, Σ_d, q0_d, F_d, δ_d, stats = determinize(Q, Σ, q0, F, δ,
+                                                      max_states=args.max_states,
+                                                      progress=report)
+    except RuntimeError as err:
+        print(f"Eroare: {err}", file=sys.stderr)
+        sys.exit(2)
+
+    save_dfa(args.dfa, Q_d, Σ_d, q0_d, F_d, δ_d, comment=f"determinizat din {args.nfa}")
+    print(f"NFA: {stats['nfa_states']} stări -> DFA: {stats['dfa_states']} stări "
+          f"({stats['final']} finale, {stats['transitions']} tranziții"
+          f"{', cu stare capcană' if stats['sink'] else ''}) în {stats['seconds']:.3f}s")
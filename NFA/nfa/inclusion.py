@@ -0,0 +1,240 @@
+"""
+inclusion.py  –  Vid, incluziune și echivalență de limbaje pentru NFA-uri
+
+Toate funcțiile lucrează pe componentele întoarse de nfa.load_nfa,
+date ca tuplu A = (Q, Σ, q0, F, δ), și întorc un contraexemplu de lungime
+minimă (cuvântul, ca șir) sau None dacă proprietatea este adevărată.
+
+  - shortest_word(A):                cel mai scurt cuvânt din L(A) (None => L(A) vid)
+  - inclusion_counterexample(A, B):  cel mai scurt cuvânt din L(A) \\ L(B)
+  - equivalence_counterexample(A, B): cel mai scurt cuvânt din diferența simetrică
+
+Incluziunea nu determinizează B: se explorează în lățime perechi (p, S), cu p o
+stare a lui A și S mulțimea de stări în care poate fi B după același cuvânt.
+Perechea (p, S) este inutilă dacă s-a văzut deja (p, S') cu S' ⊆ S – orice
+contraexemplu găsit din (p, S) se găsește cel puțin la fel de repede din (p, S')
+(„antichain”). Așa se evită, în practică, explozia construcției submulțimilor.
+
+Dacă ambele automate sunt deterministe (fără '$' și cel mult o destinație pe
+(stare, simbol)), echivalența se decide cu algoritmul Hopcroft–Karp
+(union-find pe perechi de stări); contraexemplul minim se caută apoi în
+automatul produs doar dacă răspunsul este negativ.
+
+Utilizare:
+    python inclusion.py a.nfa b.nfa            # echivalență
+    python inclusion.py a.nfa b.nfa --subset   # L(a) ⊆ L(b)?
+    python inclusion.py a.nfa --empty          # L(a) vid?
+"""
+
+import sys
+from collections import deque
+
+from nfa import closed_move, epsilon_closures, load_nfa
+
+
+def _word(parents, node):
+    """Reconstruiește cuvântul din pointerii (părinte, simbol)."""
+    out = []
+    while parents[node] is not None:
+        node, sym = parents[node]
+        out.append(sym)
+    return "".join(reversed(out))
+
+
+def shortest_word(A):
+    """
+    Cel mai scurt cuvânt acceptat de A, sau None dacă L(A) este vid.
+    """
+    Q, Σ, q0, F, δ = A
+    closures = epsilon_closures(Q, δ)
+    symbols  = sorted(Σ)
+
+    start   = closures[q0]
+    parents = {start: None}
+    queue   = deque([start])
+    while queue:
+        S = queue.popleft()
+        if not F.isdisjoint(S):
+            return _word(parents, S)
+        for a in symbols:
+            T = frozenset(closed_move(S, a, δ, closures))
+            if T and T not in parents:
+                parents[T] = (S, a)
+                queue.append(T)
+    return None
+
+
+def inclusion_counterexample(A, B):
+    """
+    Cel mai scurt cuvânt acceptat de A și respins de B, sau None dacă L(A) ⊆ L(B).
+    """
+    QA, ΣA, q0A, FA, δA = A
+    QB, _ΣB, q0B, FB, δB = B
+    clA = epsilon_closures(QA, δA)
+    clB = epsilon_closures(QB, δB)
+    symbols = sorted(ΣA)     # un cuvânt din L(A) folosește doar simboluri din ΣA
+
+    antichain = {}           # p -> listă de mulțimi S minimale (față de ⊆) văzute cu p
+    parents   = []           # id nod -> (id părinte, simbol) sau None
+    nodes     = []           # id nod -> (p, S)
+    queue     = deque()
+
+    def visit(p, S, parent):
+        """Adaugă (p, S) dacă nu e acoperit; întoarce id-ul sau None."""
+        known = antichain.setdefault(p, [])
+        for T in known:
+            if T <= S:
+                return None
+        # Mulțimile care includ S nu mai sunt necesare pentru tăierea viitoare.
+        # Nodurile lor rămân totuși în coadă: sunt la o adâncime mai mică sau egală,
+        # deci pot duce la un contraexemplu mai scurt.
+        known[:] = [T for T in known if not S <= T]
+        known.append(S)
+        nodes.append((p, S))
+        parents.append(parent)
+        queue.append(len(nodes) - 1)
+        return len(nodes) - 1
+
+    def is_counterexample(p, S):
+        return p in FA and FB.isdisjoint(S)
+
+    S0 = clB[q0B]
+    for p in clA[q0A]:
+        node = visit(p, S0, None)
+        if node is not None and is_counterexample(p, S0):
+            return ""
+
+    while queue:
+        node = queue.popleft()
+        p, S = nodes[node]
+        for a in symbols:
+            targets = closed_move((p,), a, δA, clA)
+            if not targets:
+                continue
+            Sa = frozenset(closed_move(S, a, δB, clB))
+            for p2 in targets:
+                child = visit(p2, Sa, (node, a))
+                if child is not None and is_counterexample(p2, Sa):
+                    return _word(parents, child)
+    return None
+
+
+def is_deterministic(A):
+    """
+    True dacă A nu are tranziții '$' și are cel mult o destinație pe (stare, simbol).
+    """
+    _Q, _Σ, _q0, _F, δ = A
+    return all(
+        (sym != "$" or not dsts) and len(dsts) <= 1
+        for row in δ.values() for sym, dsts in row.items()
+    )
+
+
+def _det_step(δ, q, a):
+    """Pasul unui automat determinist; None este capcana implicită."""
+    if q is None:
+        return None
+    dsts = δ[q].get(a)
+    return next(iter(dsts)) if dsts else None
+
+
+def _hopcroft_karp(A, B, symbols):
+    """
+    True dacă automatele deterministe A și B sunt echivalente.
+    Union-find pe stările ambelor automate (etichetate cu 'A'/'B').
+    """
+    _QA, _ΣA, q0A, FA, δA = A
+    _QB, _ΣB, q0B, FB, δB = B
+    parent = {}
+
+    def find(x):
+        root = x
+        while parent.get(root, root) != root:
+            root = parent[root]
+        while x != root:                     # comprimarea drumului
+            parent[x], x = root, parent.get(x, x)
+        return root
+
+    def accepting(tag, q):
+        return q is not None and q in (FA if tag == "A" else FB)
+
+    stack = [(("A", q0A), ("B", q0B))]
+    parent[find(("A", q0A))] = find(("B", q0B))
+    while stack:
+        (ta, p), (tb, q) = stack.pop()
+        if accepting(ta, p) != accepting(tb, q):
+            return False
+        for a in symbols:
+            x = ("A", _det_step(δA, p, a))
+            y = ("B", _det_step(δB, q, a))
+            rx, ry = find(x), find(y)
+            if rx != ry:
+                parent[rx] = ry
+                stack.append((x, y))
+    return True
+
+
+def _product_counterexample(A, B, symbols):
+    """
+    Cel mai scurt cuvânt acceptat de exact unul dintre automatele deterministe.
+    """
+    _QA, _ΣA, q0A, FA, δA = A
+    _QB, _ΣB, q0B, FB, δB = B
+    start   = (q0A, q0B)
+    parents = {start: None}
+    queue   = deque([start])
+    while queue:
+        p, q = pair = queue.popleft()
+        if (p is not None and p in FA) != (q is not None and q in FB):
+            return _word(parents, pair)
+        for a in symbols:
+            nxt = (_det_step(δA, p, a), _det_step(δB, q, a))
+            if nxt not in parents:
+                parents[nxt] = (pair, a)
+                queue.append(nxt)
+    return None
+
+
+def equivalence_counterexample(A, B):
+    """
+    Cel mai scurt cuvânt din L(A) Δ L(B), sau None dacă L(A) = L(B).
+    """
+    symbols = sorted(A[1] | B[1])
+    if is_deterministic(A) and is_deterministic(B):
+        if _hopcroft_karp(A, B, symbols):
+            return None
+        return _product_counterexample(A, B, symbols)
+
+    found = [w for w in (inclusion_counterexample(A, B), inclusion_counterexample(B, A))
+             if w is not None]
+    return min(found, key=len) if found else None
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Vid, incluziune și echivalență pentru NFA-uri")
+    parser.add_argument("a", help="primul fișier .nfa")
+    parser.add_argument("b", nargs="?", help="al doilea fișier .nfa")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--subset", action="store_true", help="verifică L(a) ⊆ L(b)")
+    mode.add_argument("--empty", action="store_true", help="verifică dacă L(a) e vid")
+    args = parser.parse_args()
+
+    A = load_nfa(args.a)
+    if args.empty:
+        w = shortest_word(A)
+        print("VID" if w is None else f"NEVID, de exemplu «{w}»")
+        sys.exit(0 if w is None else 1)
+
+    if args.b is None:
+        parser.error("este nevoie de al doilea automat")
+    B = load_nfa(args.b)
+
+    if args.subset:
+        w = inclusion_counterexample(A, B)
+        print("INCLUS" if w is None else f"NU E INCLUS: «{w}» e acceptat doar de {args.a}")
+    else:
+        w = equivalence_counterexample(A, B)
+        print("ECHIVALENTE" if w is None else f"DIFERITE: «{w}»")
+    sys.exit(0 if w is None else 1)
@@ -28,7 +28,12 @@ q1 b q2
 """
 
 import sys
+from collections import OrderedDict
 from pathlib import Path
+from typing import NamedTuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))   # rădăcina repo-ului
+import lfa_parser
 
 
 # Parsare fișier .nfa și încărcarea elementelor NFA-ului
@@ -38,47 +43,26 @@ def load_nfa(filepath: str):
     Fișierul trebuie să conțină secțiunile: [States], [Symbols], [Start], [Final], [Rules],
     separate de comentariul '#' sau de linii goale.
     """
-    # Inițializăm un dicționar gol pentru a păstra conținutul fiecărei secțiuni
+    # Conținutul fiecărei secțiuni, ca tupluri de simboluri; parsarea (cu
+    # cache pe disc) este cea comună din lfa_parser
     cfg = {k: [] for k in ("States", "Symbols", "Start", "Final", "Rules")}
-    section = None  # Variabilă pentru a ști în ce secțiune ne aflăm
-
-    # Deschidem fișierul .nfa și citim linie cu linie
-    with open(filepath, encoding="utf-8") as fh:
-        for raw in fh:
-            line = raw.strip()
-
-            # Eliminăm comentariile inline (orice după '#') și sărim liniile goale
-            if "#" in line:
-                line = line.split("#", 1)[0].rstrip()
-            if not line:
-                continue
-
-            # Detectăm anteturile de secțiuni [States], [Symbols] etc.
-            if line.startswith("[") and line.endswith("]"):
-                section = line[1:-1]  # Extragem numele secțiunii fără paranteze
-                if section not in cfg:
-                    # Dacă secțiunea nu e recunoscută, raportăm eroare
-                    raise ValueError(f"Secțiune necunoscută: {section}")
-                continue
-
-            # Adăugăm linia la lista potrivită din cfg
-            cfg[section].append(line)
+    cfg.update(lfa_parser.parse(filepath, tuple(cfg)))
 
     # După parsare, extragem elementele NFA-ului
-    Q   = set(cfg["States"])       # Mulțimea stărilor
-    Σ   = set(cfg["Symbols"])      # Alfabetul
-    q0  = cfg["Start"][0]          # Starea inițială (primul element din [Start])
-    F   = set(cfg["Final"])        # Mulțimea stărilor finale
+    Q   = set(lfa_parser.joined(cfg["States"]))    # Mulțimea stărilor
+    Σ   = set(lfa_parser.joined(cfg["Symbols"]))   # Alfabetul
+    q0  = " ".join(cfg["Start"][0])                # Starea inițială (primul element din [Start])
+    F   = set(lfa_parser.joined(cfg["Final"]))     # Mulțimea stărilor finale
     # Inițializăm funcția de tranziție δ cu un dicționar gol pentru fiecare stare
     δ   = {q: {} for q in Q}       
 
     # Parsăm fiecare regulă de tranziție din secțiunea [Rules]
     for rule in cfg["Rules"]:
         try:
-            src, sym, dst = rule.split()
+            src, sym, dst = rule
         except ValueError:
             # Dacă regula nu are exact 3 token-uri, e invalidă
-            raise ValueError(f"Regulă invalidă: «{rule}»")
+            raise ValueError(f"Regulă invalidă: «{' '.join(rule)}»")
 
         # Verificăm că simbolul e fie '$' (epsilon) sau face parte din alfabet
         if sym != '$' and sym not in Σ:
@@ -121,15 +105,103 @@ def move(states, symbol, δ):
     return nxt
 
 
+def epsilon_closures(Q, δ):
+    """
+    Precalculează λ-închiderea fiecărei stări, o singură dată, la încărcare.
+    Componentele tare conexe ale grafului de tranziții λ (ciclurile de '$')
+    sunt găsite cu algoritmul lui Tarjan (variantă iterativă) și au toate
+    aceeași închidere. Tarjan produce componentele în ordine topologică
+    inversă, deci închiderile succesorilor sunt gata când ajungem la o componentă.
+    Returnează un dicționar stare -> frozenset (partajat în cadrul componentei).
+    """
+    index, low = {}, {}
+    on_stack, scc_stack = set(), []
+    closures = {}
+    counter = 0
+
+    for root in Q:
+        if root in index:
+            continue
+        # Stivă de lucru: (stare, iterator peste succesorii λ)
+        work = [(root, iter(δ[root].get('$', ())))]
+        index[root] = low[root] = counter
+        counter += 1
+        scc_stack.append(root)
+        on_stack.add(root)
+
+        while work:
+            v, succ = work[-1]
+            pushed = False
+            for w in succ:
+                if w not in index:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    scc_stack.append(w)
+                    on_stack.add(w)
+                    work.append((w, iter(δ[w].get('$', ()))))
+                    pushed = True
+                    break
+                if w in on_stack:
+                    low[v] = min(low[v], index[w])
+            if pushed:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[v])
+
+            if low[v] == index[v]:
+                # v este rădăcina unei componente: o scoatem de pe stivă
+                members = []
+                while True:
+                    w = scc_stack.pop()
+                    on_stack.discard(w)
+                    members.append(w)
+                    if w == v:
+                        break
+                closure = set(members)
+                for m in members:
+                    for nxt in δ[m].get('$', ()):
+                        if nxt in closures:        # componentă deja terminată
+                            closure |= closures[nxt]
+                closure = frozenset(closure)
+                for m in members:
+                    closures[m] = closure
+
+    return closures
+
+
+def closed_move(states, symbol, δ, closures):
+    """
+    λ-închidere(move(states, symbol)) folosind închiderile precalculate.
+    """
+    nxt = set()
+    for s in states:
+        for t in δ[s].get(symbol, ()):
+            nxt |= closures[t]
+    return nxt
+
+
 
 # Funcție de acceptare a unui șir (word)
-def accepts(word, *, start, finals, δ):
+def accepts(word, *, start, finals, δ, closures=None):
     """
     Returnează True dacă NFA-ul (start, δ, finals) acceptă șirul 'word'.
     Vom parcurge fiecare caracter, aplicând move apoi epsilon_closure la fiecare pas.
+    Dacă se dau închiderile precalculate (vezi epsilon_closures), ele înlocuiesc
+    parcurgerea tranzițiilor λ de la fiecare pas.
     Dacă la final există vreun element comun între stările curente și cele finale,
     șirul e ACCEPTAT; altfel e RESPINS.
     """
+    if closures is not None:
+        current = closures[start]
+        for ch in word:
+            current = closed_move(current, ch, δ, closures)
+            if not current:
+                return False
+        return not finals.isdisjoint(current)
+
     # Începem cu ε-închiderea stării inițiale
     current = epsilon_closure({start}, δ)
     # Pentru fiecare caracter din cuvânt
@@ -144,15 +216,207 @@ def accepts(word, *, start, finals, δ):
 
 
 
+# Acceptare pentru o listă de cuvinte, cu prefixele comune simulate o singură dată
+def accepts_many(words, *, start, finals, δ, closures=None):
+    """
+    Întoarce lista verdictelor (True/False) pentru `words`, în aceeași ordine.
+    Cuvintele sunt puse într-un trie (dicționare imbricate; cheia None ține
+    indicii cuvintelor care se termină în acel nod), parcurs apoi în adâncime
+    cu mulțimea curentă de stări: un prefix comun mai multor cuvinte este
+    simulat o singură dată. Dacă mulțimea devine vidă, întregul subarbore
+    este respins fără a mai fi parcurs.
+    """
+    if closures is None:
+        closures = epsilon_closures(δ.keys(), δ)
+
+    result = []
+    trie   = {}
+    for i, w in enumerate(words):
+        node = trie
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node.setdefault(None, []).append(i)
+        result.append(False)
+
+    stack = [(trie, closures[start])]
+    while stack:
+        node, current = stack.pop()
+        for ch, child in node.items():
+            if ch is None:
+                if not finals.isdisjoint(current):
+                    for i in child:
+                        result[i] = True
+                continue
+            nxt = closed_move(current, ch, δ, closures)
+            if nxt:                    # altfel tot subarborele rămâne respins
+                stack.append((child, nxt))
+    return result
+
+
+
+# Strat de DFA „leneș” (construcția submulțimilor la cerere)
+class LazyDFA:
+    """
+    Memorează pașii simulării NFA-ului: fiecare mulțime de stări atinsă este
+    internată ca frozenset, iar succesorul ei pe fiecare simbol,
+    λ-închidere(move(S, simbol)), se calculează o singură dată.
+    Cache-ul de tranziții are cel mult `max_entries` intrări și elimină
+    intrarea folosită cel mai demult (LRU), astfel încât memoria rămâne
+    limitată chiar dacă determinizarea completă ar exploda.
+    """
+
+    __slots__ = ("δ", "finals", "closures", "start", "max_entries", "cache", "interned",
+                 "hits", "misses")
+
+    def __init__(self, start, finals, δ, *, max_entries=65536):
+        self.δ           = δ
+        self.closures    = epsilon_closures(δ.keys(), δ)
+        self.finals      = finals
+        self.max_entries = max_entries
+        self.cache       = OrderedDict()   # (S, simbol) -> S'
+        self.interned    = {}              # S -> S (o singură instanță pentru fiecare mulțime)
+        self.hits        = 0
+        self.misses      = 0
+        self.start       = self._intern(self.closures[start])
+
+    def _intern(self, states):
+        if len(self.interned) > 2 * self.max_entries:
+            # Păstrăm doar mulțimile încă referite din cache (plus starea inițială)
+            live = {self.start}
+            for (src, _sym), dst in self.cache.items():
+                live.add(src)
+                live.add(dst)
+            self.interned = {S: S for S in live}
+        return self.interned.setdefault(states, states)
+
+    def step(self, states, symbol):
+        """
+        Succesorul mulțimii `states` (obținută din LazyDFA) pe `symbol`.
+        """
+        key = (states, symbol)
+        nxt = self.cache.get(key)
+        if nxt is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return nxt
+
+        self.misses += 1
+        nxt = self._intern(frozenset(closed_move(states, symbol, self.δ, self.closures)))
+        self.cache[key] = nxt
+        if len(self.cache) > self.max_entries:
+            self.cache.popitem(last=False)   # eliminăm intrarea cea mai veche
+        return nxt
+
+    def accepts(self, word):
+        """
+        Același rezultat ca accepts(word, ...), dar pe mulțimi memorate.
+        """
+        current = self.start
+        for ch in word:
+            current = self.step(current, ch)
+            if not current:
+                return False
+        return not self.finals.isdisjoint(current)
+
+    def __len__(self):
+        return len(self.cache)
+
+
+
+# Simulare cu mulțimi de stări reprezentate ca biți ai unui int
+class BitsetNFA(NamedTuple):
+    """
+    Starea cu indicele i corespunde bitului 1 << i.
+      - start:  masca λ-închiderii stării inițiale
+      - finals: masca stărilor finale
+      - succ:   simbol -> listă cu masca λ-închidere(δ(i, simbol)) pentru fiecare i
+      - active: simbol -> masca stărilor care au măcar o tranziție pe simbol
+    """
+    states: list
+    start: int
+    finals: int
+    succ: dict
+    active: dict
+
+
+def compile_bitsets(Q, Σ, q0, F, δ, closures=None):
+    """
+    Precalculează măștile de succesori pentru simularea pe biți.
+    """
+    if closures is None:
+        closures = epsilon_closures(Q, δ)
+    states = sorted(Q)
+    bit    = {q: 1 << i for i, q in enumerate(states)}
+
+    def mask(qs):
+        m = 0
+        for q in qs:
+            m |= bit[q]
+        return m
+
+    succ, active = {}, {}
+    for sym in Σ:
+        row = [mask(closed_move((q,), sym, δ, closures)) for q in states]
+        succ[sym]   = row
+        active[sym] = mask(q for q, m in zip(states, row) if m)
+
+    return BitsetNFA(states, mask(closures[q0]), mask(F), succ, active)
+
+
+def accepts_bitset(word, nfa: BitsetNFA):
+    """
+    Ca accepts, dar mulțimea curentă este un int: un pas face OR între
+    măștile precalculate ale stărilor active, fără mulțimi Python.
+    """
+    succ, active = nfa.succ, nfa.active
+    current = nfa.start
+    for ch in word:
+        row = succ.get(ch)
+        if row is None:
+            return False                   # simbol din afara alfabetului
+        m   = current & active[ch]         # doar stările care au tranziții pe ch
+        nxt = 0
+        while m:
+            low = m & -m
+            nxt |= row[low.bit_length() - 1]
+            m ^= low
+        current = nxt
+        if not current:
+            return False
+    return bool(current & nfa.finals)
+
+
+
 # Rularea interactivă a simulării NFA
 if __name__ == "__main__":
     # Verificăm argumentele din linia de comandă
-    if len(sys.argv) != 2:
-        print("Utilizare: python nfa.py <automat.nfa>")
+    options = sys.argv[2:]
+    if len(sys.argv) < 2 or not (options in ([], ["--bitset"]) or
+                                 (len(options) == 2 and options[0] == "--batch")):
+        print("Utilizare: python nfa.py <automat.nfa> [--bitset | --batch <cuvinte.txt>]")
         sys.exit(1)
 
-    # Încărcăm NFA-ul din fișierul specificat
-    Q, Σ, q0, F, δ = load_nfa(sys.argv[1])
+    if options[:1] == ["--batch"]:
+        # Toate cuvintele din fișier (câte unul pe linie) sunt verificate împreună
+        Q, Σ, q0, F, δ = load_nfa(sys.argv[1])
+        words = Path(options[1]).read_text(encoding="utf-8").splitlines()
+        verdicts = accepts_many(words, start=q0, finals=F, δ=δ)
+        sys.stdout.write("".join("ACCEPTAT\n" if v else "RESPINS\n" for v in verdicts))
+        sys.exit(0)
+
+    # Un NFA compilat cu nfa_bin.py este doar mapat în memorie
+    from nfa_bin import accepts_bin, is_binary, load_bin
+    if is_binary(sys.argv[1]):
+        compiled = load_bin(sys.argv[1])
+        check = lambda w: accepts_bin(w, compiled)
+    else:
+        # Încărcăm NFA-ul din fișierul specificat
+        Q, Σ, q0, F, δ = load_nfa(sys.argv[1])
+        if "--bitset" in sys.argv:
+            bitset_nfa = compile_bitsets(Q, Σ, q0, F, δ)
+            check = lambda w: accepts_bitset(w, bitset_nfa)
+        else:
+            check = LazyDFA(q0, F, δ).accepts
 
     print("Introduceți cuvinte (quit, exit sau linie goală => oprire):")
     while True:
@@ -162,5 +426,5 @@ if __name__ == "__main__":
             break
 
         # Verificăm dacă NFA acceptă șirul w și afișăm rezultat
-        verdict = accepts(w, start=q0, finals=F, δ=δ)
+        verdict = check(w)
         print("ACCEPTAT" if verdict else "RESPINS")
\ No newline at end of file
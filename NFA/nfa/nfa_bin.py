@@ -0,0 +1,199 @@
+"""
+nfa_bin.py  –  Format binar pentru NFA-uri compilate, încărcat prin mmap
+
+Stările și simbolurile primesc indici întregi (ε – simbolul '$' – are ultima
+coloană), iar δ devine o reprezentare „CSR”: pentru celula (stare i, coloana c)
+destinațiile sunt targets[offsets[i * W + c] : offsets[i * W + c + 1]],
+unde W = |Σ| + 1. Fișierul binar este doar mapat în memorie la pornire, iar
+`offsets` și `targets` sunt vederi directe peste paginile lui, partajate
+între toate procesele care îl încarcă.
+
+FORMAT (ordinea octeților: cea nativă, verificată prin câmpul `marker`):
+
+    antet        MAGIC (8 octeți) + 6 x uint32:
+                 marker, nstates, nsymbols, start, ntargets, names_len
+    finals       nstates octeți (0/1)
+    (umplutură până la multiplu de 4)
+    offsets      (nstates * (nsymbols + 1) + 1) x int32
+    targets      ntargets x int32
+    names        UTF-8: numele stărilor, apoi simbolurile, separate prin '\\n'
+
+Utilizare:
+    python nfa_bin.py automat.nfa automat.nfab
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from typing import NamedTuple
+
+from nfa import load_nfa
+
+MAGIC  = b"LFANFA01"
+HEADER = struct.Struct("=6I")     # ordinea nativă, ca tablourile scrise cu tobytes()
+MARKER = 0x01020304
+
+
+class CompiledNFA(NamedTuple):
+    """
+    NFA cu indici întregi și tranziții în format CSR (vezi docstring-ul modulului).
+    """
+    states: list      # id -> numele stării
+    symbols: list     # coloană -> simbol (fără '$')
+    columns: dict     # simbol -> coloană; '$' are coloana len(symbols)
+    start: int
+    finals: bytes     # finals[i] == 1 dacă starea i e finală
+    offsets: array
+    targets: array
+
+
+def compile_nfa(Q, Σ, q0, F, δ):
+    """
+    Construiește un CompiledNFA din componentele întoarse de load_nfa.
+    Stările și simbolurile sunt sortate, ca rezultatul să fie reproductibil.
+    """
+    states  = sorted(Q)
+    symbols = sorted(Σ)
+    ids     = {q: i for i, q in enumerate(states)}
+    columns = {sym: c for c, sym in enumerate(symbols)}
+    columns["$"] = len(symbols)
+
+    offsets = array("i", [0])
+    targets = array("i")
+    for q in states:
+        row = δ[q]
+        for sym in [*symbols, "$"]:
+            targets.extend(sorted(ids[d] for d in row.get(sym, ())))
+            offsets.append(len(targets))
+
+    finals = bytes(1 if q in F else 0 for q in states)
+    return CompiledNFA(states, symbols, columns, ids[q0], finals, offsets, targets)
+
+
+def save_bin(filepath: str, nfa: CompiledNFA):
+    """
+    Scrie NFA-ul compilat în format binar.
+    """
+    names = "\n".join([*nfa.states, *nfa.symbols]).encode("utf-8")
+    nstates = len(nfa.states)
+
+    with open(filepath, "wb") as fh:
+        fh.write(MAGIC)
+        fh.write(HEADER.pack(MARKER, nstates, len(nfa.symbols), nfa.start,
+                             len(nfa.targets), len(names)))
+        fh.write(bytes(nfa.finals))
+        fh.write(bytes(-nstates % 4))
+        fh.write(array("i", nfa.offsets).tobytes())
+        fh.write(array("i", nfa.targets).tobytes())
+        fh.write(names)
+
+
+def is_binary(filepath: str):
+    """
+    True dacă fișierul începe cu antetul formatului binar.
+    """
+    with open(filepath, "rb") as fh:
+        return fh.read(len(MAGIC)) == MAGIC
+
+
+def load_bin(filepath: str):
+    """
+    Mapează fișierul binar în memorie și întoarce un CompiledNFA ale cărui
+    `finals`, `offsets` și `targets` sunt vederi peste mmap (fără copiere).
+    """
+    with open(filepath, "rb") as fh:
+        mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if mm[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{filepath} nu este un NFA binar")
+    pos = len(MAGIC)
+    marker, nstates, nsymbols, start, ntargets, names_len = HEADER.unpack_from(mm, pos)
+    if marker != MARKER:
+        raise ValueError(f"{filepath} a fost scris pe o mașină cu altă ordine a octeților")
+    pos += HEADER.size
+
+    view = memoryview(mm)
+    finals = view[pos:pos + nstates]
+    pos += nstates + (-nstates % 4)
+
+    noffsets = nstates * (nsymbols + 1) + 1
+    offsets = view[pos:pos + 4 * noffsets].cast("i")
+    pos += 4 * noffsets
+    targets = view[pos:pos + 4 * ntargets].cast("i")
+    pos += 4 * ntargets
+    names = bytes(view[pos:pos + names_len]).decode("utf-8").split("\n") if names_len else []
+
+    states, symbols = names[:nstates], names[nstates:]
+    columns = {sym: c for c, sym in enumerate(symbols)}
+    columns["$"] = nsymbols
+    return CompiledNFA(states, symbols, columns, start, finals, offsets, targets)
+
+
+def to_delta(nfa: CompiledNFA):
+    """
+    Reface forma întoarsă de load_nfa: (Q, Σ, q0, F, δ).
+    """
+    width = len(nfa.symbols) + 1
+    cols  = [*nfa.symbols, "$"]
+    δ = {q: {} for q in nfa.states}
+    for i, q in enumerate(nfa.states):
+        for c, sym in enumerate(cols):
+            lo, hi = nfa.offsets[i * width + c], nfa.offsets[i * width + c + 1]
+            if lo < hi:
+                δ[q][sym] = {nfa.states[t] for t in nfa.targets[lo:hi]}
+    F = {q for i, q in enumerate(nfa.states) if nfa.finals[i]}
+    return set(nfa.states), set(nfa.symbols), nfa.states[nfa.start], F, δ
+
+
+def accepts_bin(word, nfa: CompiledNFA):
+    """
+    Ca nfa.accepts, dar direct pe tabelele CSR (mulțimi de indici întregi).
+    """
+    offsets, targets = nfa.offsets, nfa.targets
+    width = len(nfa.symbols) + 1
+    eps   = width - 1
+
+    def closure(states):
+        stack = list(states)
+        seen  = set(states)
+        while stack:
+            cell = stack.pop() * width + eps
+            for t in targets[offsets[cell]:offsets[cell + 1]]:
+                if t not in seen:
+                    seen.add(t)
+                    stack.append(t)
+        return seen
+
+    current = closure({nfa.start})
+    for ch in word:
+        c = nfa.columns.get(ch)
+        if c is None or c == eps:
+            return False
+        nxt = set()
+        for s in current:
+            cell = s * width + c
+            nxt.update(targets[offsets[cell]:offsets[cell + 1]])
+        current = closure(nxt)
+        if not current:
+            return False
+    return any(nfa.finals[s] for s in current)
+
+
+def compile_file(src: str, dst: str):
+    """
+    Compilează un fișier text .nfa în format binar.
+    """
+    nfa = compile_nfa(*load_nfa(src))
+    save_bin(dst, nfa)
+    return nfa
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Utilizare: python nfa_bin.py <automat.nfa> <automat.nfab>")
+        sys.exit(1)
+
+    nfa = compile_file(sys.argv[1], sys.argv[2])
+    print(f"{len(nfa.states)} stări, {len(nfa.symbols)} simboluri, "
+          f"{len(nfa.targets)} tranziții -> {sys.argv[2]}")
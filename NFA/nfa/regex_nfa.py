@@ -0,0 +1,290 @@
+"""
+regex_nfa.py  –  Expresii regulate -> λ-NFA (construcția lui Thompson) și căutare în text
+
+Sintaxa acceptată:
+    ab          concatenare
+    a|b         alternativă
+    a*  a+  a?  repetiție (zero sau mai multe / una sau mai multe / opțional)
+    ( ... )     grupare; „()” este cuvântul vid
+    [abc] [a-z] clasă de caractere; [^...] este complementul față de alfabet
+    .           orice simbol din alfabet
+    \\c          caracterul c luat literal (de ex. \\*, \\., \\\\)
+
+'.' și [^...] au nevoie de alfabetul explicit (parametrul `alphabet`).
+Caracterul '$' nu poate fi simbol, fiindcă în formatul .nfa marchează λ.
+
+compile_regex întoarce aceleași componente ca nfa.load_nfa: (Q, Σ, q0, F, δ),
+deci rezultatul merge cu accepts, LazyDFA, determinize etc.
+
+search parcurge textul o singură dată, simulând NFA-ul pornit din fiecare
+poziție simultan (fiecare stare activă ține minte cea mai din stânga poziție
+de start care a ajuns în ea), și raportează potrivirile.
+
+Utilizare:
+    python regex_nfa.py "<expresie>" fișier.txt       # afișează „start end” pe linie
+    python regex_nfa.py "<expresie>" --nfa ieșire.nfa  # scrie NFA-ul generat
+    python regex_nfa.py "<expresie>" fișier.txt --alphabet abc
+
+În linia de comandă, dacă expresia folosește '.' sau [^...] și lipsește
+--alphabet, alfabetul este mulțimea caracterelor din fișierul căutat
+(citit o dată în plus).
+"""
+
+import sys
+
+from nfa import epsilon_closures
+
+SPECIAL = set("|*+?()[].\\")
+
+
+class _Builder:
+    """
+    Parser recursiv-descendent care construiește direct fragmentele Thompson.
+    Un fragment este perechea (stare de intrare, stare de ieșire).
+    """
+
+    def __init__(self, pattern, alphabet):
+        self.pattern  = pattern
+        self.pos      = 0
+        self.alphabet = alphabet
+        self.δ        = {}
+        self.symbols  = set()
+
+    # --- construcția automatului ---
+    def new_state(self):
+        q = f"r{len(self.δ)}"
+        self.δ[q] = {}
+        return q
+
+    def edge(self, src, sym, dst):
+        self.δ[src].setdefault(sym, set()).add(dst)
+
+    def chars(self, symbols):
+        """Fragment care citește un singur simbol din mulțimea dată."""
+        s, e = self.new_state(), self.new_state()
+        for c in symbols:
+            if c == "$":
+                raise ValueError("Simbolul '$' este rezervat pentru λ-tranziții")
+            self.symbols.add(c)
+            self.edge(s, c, e)
+        return s, e
+
+    def empty(self):
+        s, e = self.new_state(), self.new_state()
+        self.edge(s, "$", e)
+        return s, e
+
+    # --- parsare ---
+    def error(self, msg):
+        raise ValueError(f"Expresie invalidă la poziția {self.pos}: {msg} «{self.pattern}»")
+
+    def peek(self):
+        return self.pattern[self.pos] if self.pos < len(self.pattern) else None
+
+    def take(self):
+        c = self.peek()
+        if c is None:
+            self.error("sfârșit neașteptat")
+        self.pos += 1
+        return c
+
+    def parse(self):
+        frag = self.alternation()
+        if self.peek() is not None:
+            self.error(f"caracter neașteptat «{self.peek()}»")
+        return frag
+
+    def alternation(self):
+        branches = [self.concatenation()]
+        while self.peek() == "|":
+            self.pos += 1
+            branches.append(self.concatenation())
+        if len(branches) == 1:
+            return branches[0]
+        s, e = self.new_state(), self.new_state()
+        for bs, be in branches:
+            self.edge(s, "$", bs)
+            self.edge(be, "$", e)
+        return s, e
+
+    def concatenation(self):
+        frags = []
+        while self.peek() not in (None, "|", ")"):
+            frags.append(self.repetition())
+        if not frags:
+            return self.empty()
+        s, e = frags[0]
+        for fs, fe in frags[1:]:
+            self.edge(e, "$", fs)
+            e = fe
+        return s, e
+
+    def repetition(self):
+        fs, fe = self.atom()
+        while self.peek() in ("*", "+", "?"):
+            op = self.take()
+            s, e = self.new_state(), self.new_state()
+            self.edge(s, "$", fs)
+            self.edge(fe, "$", e)
+            if op in "*?":
+                self.edge(s, "$", e)       # zero apariții
+            if op in "*+":
+                self.edge(fe, "$", fs)     # încă o apariție
+            fs, fe = s, e
+        return fs, fe
+
+    def atom(self):
+        c = self.take()
+        if c == "(":
+            frag = self.alternation()
+            if self.peek() != ")":
+                self.error("lipsește «)»")
+            self.pos += 1
+            return frag
+        if c == "[":
+            return self.chars(self.char_class())
+        if c == ".":
+            return self.chars(self.need_alphabet("."))
+        if c == "\\":
+            return self.chars(self.take())
+        if c in SPECIAL:
+            self.error(f"«{c}» trebuie precedat de «\\»")
+        return self.chars(c)
+
+    def char_class(self):
+        negate = self.peek() == "^"
+        if negate:
+            self.pos += 1
+        members = set()
+        first = True
+        while first or self.peek() != "]":
+            first = False
+            c = self.take()
+            if c == "\\":
+                c = self.take()
+            if self.peek() == "-" and self.pos + 1 < len(self.pattern) and self.pattern[self.pos + 1] != "]":
+                self.pos += 1
+                hi = self.take()
+                if hi == "\\":
+                    hi = self.take()
+                if ord(hi) < ord(c):
+                    self.error(f"interval invers «{c}-{hi}»")
+                members.update(chr(x) for x in range(ord(c), ord(hi) + 1))
+            else:
+                members.add(c)
+        self.pos += 1   # „]”
+        if negate:
+            return self.need_alphabet("[^...]") - members
+        return members
+
+    def need_alphabet(self, what):
+        if self.alphabet is None:
+            self.error(f"«{what}» necesită parametrul alphabet")
+        return set(self.alphabet) - {"$"}
+
+
+def compile_regex(pattern: str, alphabet=None):
+    """
+    Construiește λ-NFA-ul Thompson pentru `pattern`.
+    Întoarce (Q, Σ, q0, F, δ), ca nfa.load_nfa.
+    """
+    b = _Builder(pattern, alphabet)
+    start, end = b.parse()
+    Σ = b.symbols | (set(alphabet) if alphabet is not None else set())
+    Σ.discard("$")
+    return set(b.δ), Σ, start, {end}, b.δ
+
+
+def search(text, Q, Σ, q0, F, δ, closures=None):
+    """
+    Caută potrivirile NFA-ului în `text` (orice iterabil de caractere, deci și
+    un flux citit pe bucăți), într-o singură trecere.
+
+    Produce perechi (start, end) – pentru fiecare poziție `end` la care se
+    termină o potrivire nevidă, `start` este cea mai din stânga poziție de
+    început a unei potriviri care se termină acolo (text[start:end]).
+    """
+    if closures is None:
+        closures = epsilon_closures(Q, δ)
+    start_closure = closures[q0]
+
+    threads = {}          # stare -> cea mai mică poziție de start care a ajuns aici
+    pos = 0
+    for ch in text:
+        # Pornim un fir nou la poziția curentă (nu înlocuiește un start mai vechi)
+        for q in start_closure:
+            threads.setdefault(q, pos)
+
+        best = min((st for q, st in threads.items() if q in F), default=None)
+        if best is not None and best < pos:
+            yield best, pos
+
+        nxt = {}
+        for q, st in threads.items():
+            # '$' din text nu este simbol: cheia '$' din δ înseamnă λ
+            for t in (δ[q].get(ch, ()) if ch != "$" else ()):
+                for u in closures[t]:
+                    if nxt.get(u, st) >= st:
+                        nxt[u] = st
+        threads = nxt
+        pos += 1
+
+    # Potrivirile care se termină chiar la sfârșitul textului
+    best = min((st for q, st in threads.items() if q in F), default=None)
+    if best is not None and best < pos:
+        yield best, pos
+
+
+def write_nfa(filepath, Q, Σ, q0, F, δ):
+    """
+    Scrie NFA-ul în formatul .nfa citit de nfa.load_nfa. Simbolurile cu spații
+    sau „#” nu au reprezentare în acest format.
+    """
+    bad = sorted(a for a in Σ if "#" in a or a != a.strip() or " " in a)
+    if bad:
+        raise ValueError(f"Simbolurile {bad} nu pot fi scrise într-un fișier .nfa")
+    states = sorted(Q, key=lambda q: int(q[1:]) if q[1:].isdigit() else q)
+    with open(filepath, "w", encoding="utf-8") as fh:
+        fh.write("[States]\n" + "".join(f"{q}\n" for q in states) + "\n")
+        fh.write("[Symbols]\n" + "".join(f"{a}\n" for a in sorted(Σ)) + "\n")
+        fh.write(f"[Start]\n{q0}\n\n")
+        fh.write("[Final]\n" + "".join(f"{q}\n" for q in sorted(F)) + "\n")
+        fh.write("[Rules]\n")
+        for q in states:
+            for sym, dsts in sorted(δ[q].items()):
+                fh.write("".join(f"{q} {sym} {d}\n" for d in sorted(dsts)))
+
+
+def _read_chars(path, chunk_size=1 << 20):
+    with open(path, encoding="utf-8") as fh:
+        while True:
+            block = fh.read(chunk_size)
+            if not block:
+                return
+            yield from block
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Expresii regulate pe motorul NFA")
+    parser.add_argument("expresie")
+    parser.add_argument("text", nargs="?", help="fișierul în care se caută")
+    parser.add_argument("--nfa", metavar="FIȘIER", help="scrie NFA-ul generat în FIȘIER")
+    parser.add_argument("--alphabet", metavar="CARACTERE",
+                        help="alfabetul pentru '.' și [^...] (implicit: caracterele din text)")
+    args = parser.parse_args()
+
+    alphabet = set(args.alphabet) if args.alphabet is not None else None
+    if alphabet is None and args.text and ("." in args.expresie or "[^" in args.expresie):
+        alphabet = set(_read_chars(args.text))
+    try:
+        nfa = compile_regex(args.expresie, alphabet)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.nfa:
+        write_nfa(args.nfa, *nfa)
+    if args.text:
+        out = sys.stdout
+        for start, end in search(_read_chars(args.text), *nfa):
+            out.write(f"{start} {end}\n")
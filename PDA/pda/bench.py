@@ -0,0 +1,94 @@
+"""
+bench.py  –  Compară motoarele de simulare PDA pe cuvinte lungi
+
+  - file.pda (0ⁿ1ⁿ, determinist): cuvinte acceptate și respinse de lungime mare,
+    inclusiv cu motorul DPDA într-o singură trecere;
+  - un PDA ambiguu: pentru fiecare 'a' pune X sau Y pe stivă, apoi 'b' scoate
+    X și 'c' scoate Y. Pe aⁿbⁿc (respins), DFS-ul încearcă toate cele 2ⁿ
+    stive posibile, iar Earley rămâne polinomial.
+
+Un motor care depășește limita de configurații (RecursionError) sau timpul
+alocat este raportat ca „—”.
+
+Utilizare:
+    python bench.py [--sizes 10,14,18,500,2000] [--budget SECUNDE]
+"""
+
+import time
+from pathlib import Path
+
+from grammar import earley_accepts, pda_to_grammar
+from pda import accepts, accepts_dpda, index_rules, is_deterministic, load_pda
+
+# PDA ambiguu: (Q, Σ, Γ, q0, Z0, F, δ), în forma întoarsă de load_pda
+AMBIGUOUS = (
+    {"p", "q", "f"}, {"a", "b", "c"}, {"X", "Y", "Z"}, "p", "Z", {"f"},
+    {
+        "p": [("a", "$", "p", "X"), ("a", "$", "p", "Y"), ("$", "$", "q", "$")],
+        "q": [("b", "X", "q", "$"), ("c", "Y", "q", "$"), ("$", "Z", "f", "Z")],
+        "f": [],
+    },
+)
+
+
+def _time(fn, word, budget):
+    """
+    Întoarce (verdict, secunde) sau (None, motiv) dacă motorul nu termină.
+    """
+    t0 = time.perf_counter()
+    try:
+        verdict = fn(word)
+    except RecursionError:
+        return None, "limită configurații"
+    elapsed = time.perf_counter() - t0
+    if elapsed > budget:
+        return verdict, f"{elapsed:.2f}s (peste buget)"
+    return verdict, f"{elapsed:.4f}s"
+
+
+def bench(name, pda, words, budget):
+    Q, Σ, Γ, q0, Z0, F, δ = pda
+    t0 = time.perf_counter()
+    g = pda_to_grammar(Q, Σ, Γ, q0, Z0, F, δ)
+    print(f"\n{name}: gramatică cu {len(g.names)} neterminale, {len(g.lhs)} producții "
+          f"({time.perf_counter() - t0:.4f}s)")
+
+    index = index_rules(δ)
+    engines = {
+        "dfs":    lambda w: accepts(w, start=q0, z0=Z0, finals=F, δ=δ,
+                                    max_configs=2_000_000, index=index),
+        "earley": lambda w: earley_accepts(w, g),
+    }
+    if is_deterministic(δ):
+        engines["dpda"] = lambda w: accepts_dpda(w, start=q0, z0=Z0, finals=F, index=index)
+    print(f"  {'cuvânt':<18} {'n':>6}  " + "  ".join(f"{e:>22}" for e in engines))
+    for label, word in words:
+        cells = []
+        for fn in engines.values():
+            verdict, how = _time(fn, word, budget)
+            mark = "—" if verdict is None else ("A" if verdict else "R")
+            cells.append(f"{mark} {how:>20}")
+        print(f"  {label:<18} {len(word):>6}  " + "  ".join(cells))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="DFS, DPDA și Earley pe cuvinte lungi")
+    parser.add_argument("--sizes", default="8,12,16,20,500,2000",
+                        help="valorile lui n, separate prin virgulă")
+    parser.add_argument("--budget", type=float, default=30.0,
+                        help="timp orientativ pe rulare, în secunde")
+    args = parser.parse_args()
+    sizes = [int(x) for x in args.sizes.split(",")]
+
+    here = Path(__file__).resolve().parent
+    bench("file.pda (0ⁿ1ⁿ)", load_pda(here / "file.pda"),
+          [(lbl, w) for n in sizes
+           for lbl, w in ((f"0^{n} 1^{n}", "0" * n + "1" * n),
+                          (f"0^{n} 1^{n - 1}", "0" * n + "1" * (n - 1)))],
+          args.budget)
+    bench("PDA ambiguu (X/Y)", AMBIGUOUS,
+          [(f"a^{n} b^{n} c", "a" * n + "b" * n + "c") for n in sizes if n <= 40]
+          + [(f"a^{n} b^{n}", "a" * n + "b" * n) for n in sizes],
+          args.budget)
@@ -0,0 +1,287 @@
+"""
+grammar.py  –  Apartenența la limbajul unui PDA în timp polinomial
+
+PDA-ul întors de pda.load_pda este transformat într-o gramatică independentă
+de context echivalentă (construcția cu triplete [p X q]), iar apartenența unui
+cuvânt se decide cu algoritmul Earley – O(n³) în cel mai rău caz, chiar și
+pentru automate ambigue, unde căutarea DFS din pda.accepts este exponențială.
+
+Normalizarea PDA-ului înainte de construcție:
+  - sub Z0 se pune un marcaj de fund ⊥, care nu poate fi scos decât la final;
+  - o tranziție care nu scoate nimic ('$' pe stivă) devine câte o tranziție
+    „scoate X, pune γX” pentru fiecare simbol X de stivă (inclusiv ⊥);
+  - un push de lungime k > 2 este împărțit în k - 1 pași λ prin stări noi,
+    fiecare scoțând un simbol și punând cel mult două;
+  - din fiecare stare finală se poate trece (λ) într-o stare nouă q_e, care
+    golește stiva – acceptarea prin stare finală devine acceptare prin stivă vidă.
+
+Neterminalul [p X q] generează exact cuvintele citite de la starea p, cu X în
+vârful stivei, până în starea q, cu X scos. Producțiile neproductive și cele
+inaccesibile din S sunt eliminate.
+
+Utilizare:
+    python grammar.py automat.pda            # afișează gramatica
+    python grammar.py automat.pda cuvânt ...  # verifică apartenența
+"""
+
+import sys
+from typing import NamedTuple
+
+from pda import load_pda
+
+BOTTOM = "⊥"
+END    = "q_e"
+
+
+class Grammar(NamedTuple):
+    """
+    Gramatică cu neterminale numerotate 0 .. len(names) - 1; terminalele sunt
+    șiruri de un caracter. Producția i este lhs[i] -> rhs[i].
+    """
+    names: list       # neterminal -> nume („S” sau „[p X q]”)
+    start: int
+    lhs: list         # producție -> neterminal
+    rhs: list         # producție -> tuplu de terminale (str) și neterminale (int)
+    by_lhs: list      # neterminal -> lista producțiilor lui
+    nullable: bytes   # nullable[A] == 1 dacă A =>* λ
+
+
+def _normalize(Q, Γ, q0, Z0, F, δ):
+    """
+    Întoarce (stări, simboluri de stivă, tranziții) pentru PDA-ul normalizat;
+    fiecare tranziție este (p, a, X, r, push) cu a = '' pentru λ, X un simbol
+    care este scos mereu și len(push) <= 2.
+    """
+    stack_syms = set(Γ) | {Z0}
+    for rules in δ.values():
+        for _insym, popsym, _dst, push in rules:
+            if popsym != "$":
+                stack_syms.add(popsym)
+            if push != "$":
+                stack_syms.update(push)
+    stack_syms = sorted(stack_syms) + [BOTTOM]
+
+    states = sorted(Q)
+    trans  = []
+
+    def add(p, a, X, r, push):
+        if len(push) <= 2:
+            trans.append((p, a, X, r, push))
+            return
+        # Pushul lung se face de jos în sus, câte un simbol pe pas.
+        prefix = f"{p}→{r}#{len(trans)}"
+        cur, top = p, X
+        for j in range(len(push) - 1, 1, -1):
+            mid = f"{prefix}.{j}"
+            states.append(mid)
+            trans.append((cur, a, top, mid, push[j - 1] + push[j]))
+            cur, top, a = mid, push[j - 1], ""
+        trans.append((cur, a, top, r, push[0] + push[1]))
+
+    for p in sorted(δ):
+        for insym, popsym, dst, push in δ[p]:
+            a = "" if insym == "$" else insym
+            γ = "" if push == "$" else push
+            if popsym == "$":
+                for X in stack_syms:
+                    add(p, a, X, dst, γ + X)
+            else:
+                add(p, a, popsym, dst, γ)
+
+    states.append(END)
+    for X in stack_syms:
+        for f in F:
+            trans.append((f, "", X, END, ""))
+        trans.append((END, "", X, END, ""))
+    return states, stack_syms, trans
+
+
+def pda_to_grammar(Q, Σ, Γ, q0, Z0, F, δ):
+    """
+    Construiește gramatica echivalentă PDA-ului (argumentele sunt cele
+    întoarse de load_pda) și întoarce un Grammar redus.
+    """
+    states, _stack_syms, trans = _normalize(Q, Γ, q0, Z0, F, δ)
+
+    ids   = {"S": 0}
+    names = ["S"]
+
+    def nt(p, X, q):
+        key = (p, X, q)
+        nid = ids.get(key)
+        if nid is None:
+            nid = ids[key] = len(names)
+            names.append(f"[{p} {X} {q}]")
+        return nid
+
+    prods = [(0, (nt(q0, Z0, s), nt(s, BOTTOM, END))) for s in states]
+    for p, a, X, r, push in trans:
+        head = (a,) if a else ()
+        if not push:
+            prods.append((nt(p, X, r), head))
+        elif len(push) == 1:
+            for q in states:
+                prods.append((nt(p, X, q), head + (nt(r, push, q),)))
+        else:
+            Y1, Y2 = push
+            for s in states:
+                first = nt(r, Y1, s)
+                for q in states:
+                    prods.append((nt(p, X, q), head + (first, nt(s, Y2, q))))
+
+    return _reduce(names, prods)
+
+
+def _reduce(names, prods):
+    """
+    Elimină neterminalele neproductive și pe cele inaccesibile din S (id 0)
+    și renumerotează ce rămâne.
+    """
+    n = len(names)
+
+    # Productive: punct fix cu numărătoare de neterminale încă neproductive.
+    missing = [sum(1 for s in rhs if type(s) is int) for _lhs, rhs in prods]
+    users   = [[] for _ in range(n)]
+    for i, (_lhs, rhs) in enumerate(prods):
+        for s in rhs:
+            if type(s) is int:
+                users[s].append(i)
+    productive = [False] * n
+    work = [i for i, m in enumerate(missing) if m == 0]
+    while work:
+        A = prods[work.pop()][0]
+        if productive[A]:
+            continue
+        productive[A] = True
+        for i in users[A]:
+            missing[i] -= 1
+            if missing[i] == 0:
+                work.append(i)
+
+    useful = [(lhs, rhs) for lhs, rhs in prods
+              if productive[lhs] and all(type(s) is not int or productive[s] for s in rhs)]
+    by_old = [[] for _ in range(n)]
+    for lhs, rhs in useful:
+        by_old[lhs].append(rhs)
+
+    # Accesibile din S, în ordinea descoperirii (S rămâne 0).
+    new_id = {0: 0}
+    order  = [0]
+    for A in order:
+        for rhs in by_old[A]:
+            for s in rhs:
+                if type(s) is int and s not in new_id:
+                    new_id[s] = len(order)
+                    order.append(s)
+
+    lhs_out, rhs_out = [], []
+    by_lhs = [[] for _ in order]
+    for A in order:
+        for rhs in by_old[A]:
+            by_lhs[new_id[A]].append(len(lhs_out))
+            lhs_out.append(new_id[A])
+            rhs_out.append(tuple(new_id[s] if type(s) is int else s for s in rhs))
+
+    return Grammar([names[A] for A in order], 0, lhs_out, rhs_out, by_lhs,
+                   _nullable(len(order), lhs_out, rhs_out))
+
+
+def _nullable(n, lhs, rhs):
+    nullable = bytearray(n)
+    changed = True
+    while changed:
+        changed = False
+        for A, body in zip(lhs, rhs):
+            if not nullable[A] and all(type(s) is int and nullable[s] for s in body):
+                nullable[A] = 1
+                changed = True
+    return bytes(nullable)
+
+
+def earley_accepts(word, g: Grammar):
+    """
+    True dacă S =>* word. Elementele Earley sunt (producție, punct, origine);
+    neterminalele anulabile sunt sărite direct la predicție (Aycock–Horspool),
+    deci nu e nevoie de tratament special pentru completările vide.
+    """
+    if not g.by_lhs[g.start]:
+        return False                      # limbaj vid după reducere
+    lhs, rhs, by_lhs, nullable = g.lhs, g.rhs, g.by_lhs, g.nullable
+    n = len(word)
+
+    chart   = [[(p, 0, 0) for p in by_lhs[g.start]]]
+    seen    = set(chart[0])
+    waiting = []                          # waiting[k][A] = elemente din setul k care așteaptă A
+
+    for k in range(n + 1):
+        items = chart[k]
+        wait  = {}
+        waiting.append(wait)
+        predicted = set()
+        nxt, nxt_seen = [], set()
+        a = word[k] if k < n else None
+
+        def add(item):
+            if item not in seen:
+                seen.add(item)
+                items.append(item)
+
+        i = 0
+        while i < len(items):
+            p, dot, origin = items[i]
+            i += 1
+            body = rhs[p]
+            if dot < len(body):
+                sym = body[dot]
+                if type(sym) is str:      # scanare
+                    if sym == a:
+                        item = (p, dot + 1, origin)
+                        if item not in nxt_seen:
+                            nxt_seen.add(item)
+                            nxt.append(item)
+                    continue
+                wait.setdefault(sym, []).append((p, dot, origin))
+                if sym not in predicted:  # predicție
+                    predicted.add(sym)
+                    for q in by_lhs[sym]:
+                        add((q, 0, k))
+                if nullable[sym]:
+                    add((p, dot + 1, origin))
+            else:                         # completare
+                A = lhs[p]
+                for q, d, o in waiting[origin].get(A, ()):
+                    add((q, d + 1, o))
+
+        if k == n:
+            return any(lhs[p] == g.start and dot == len(rhs[p]) and origin == 0
+                       for p, dot, origin in items)
+        if not nxt:
+            return False
+        chart.append(nxt)
+        seen = nxt_seen
+    return False
+
+
+def format_grammar(g: Grammar):
+    """
+    Gramatica în formă lizibilă, câte o producție pe linie.
+    """
+    lines = []
+    for A, prods in enumerate(g.by_lhs):
+        for p in prods:
+            body = " ".join(s if type(s) is str else g.names[s] for s in g.rhs[p])
+            lines.append(f"{g.names[A]} -> {body or 'λ'}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Utilizare: python grammar.py <automat.pda> [cuvânt ...]")
+        sys.exit(1)
+
+    g = pda_to_grammar(*load_pda(sys.argv[1]))
+    if len(sys.argv) == 2:
+        print(format_grammar(g))
+        print(f"# {len(g.names)} neterminale, {len(g.lhs)} producții", file=sys.stderr)
+    for w in sys.argv[2:]:
+        print(f"{w}: {'ACCEPTAT' if earley_accepts(w, g) else 'RESPINS'}")
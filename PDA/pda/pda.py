@@ -1,83 +1,224 @@
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))   # rădăcina repo-ului
+import lfa_parser
+
 
 # INCARCARE PDA
 def load_pda(path: str):
     cfg = {k: [] for k in (
         "States", "InputSymbols", "StackSymbols",
         "Start", "StackStart", "Final", "Rules")}
-    section = None
-    for raw in Path(path).read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if "#" in line:
-            line = line.split("#", 1)[0].rstrip()
-        if not line:
-            continue
-        if line.startswith("[") and line.endswith("]"):
-            section = line[1:-1]
-            continue
-        cfg[section].append(line)
-
-    Q   = set(cfg["States"])
-    Σ   = set(cfg["InputSymbols"])
-    Γ   = set(cfg["StackSymbols"])
-    q0  = cfg["Start"][0]
-    Z0  = cfg["StackStart"][0]
-    F   = set(cfg["Final"])
+    cfg.update(lfa_parser.parse(path, tuple(cfg)))   # parserul comun, cu cache
+
+    Q   = set(lfa_parser.joined(cfg["States"]))
+    Σ   = set(lfa_parser.joined(cfg["InputSymbols"]))
+    Γ   = set(lfa_parser.joined(cfg["StackSymbols"]))
+    q0  = " ".join(cfg["Start"][0])
+    Z0  = " ".join(cfg["StackStart"][0])
+    F   = set(lfa_parser.joined(cfg["Final"]))
     δ   = {q: [] for q in Q}              # listă de tranziţii
 
     for rule in cfg["Rules"]:
-        src, insym, popsym, dst, push = rule.split()
+        src, insym, popsym, dst, push = rule
         δ[src].append((insym, popsym, dst, push))
     return Q, Σ, Γ, q0, Z0, F, δ
 
 
 
+# INDEXAREA TRANZIŢIILOR
+#
+# index[(stare, simbol intrare, simbol scos)] = listă de (destinaţie, push),
+# cu '$' pentru λ / „nu scoate nimic”. La un pas se caută doar cele cel mult
+# patru chei compatibile cu configuraţia, nu toată lista δ[stare].
+def index_rules(δ):
+    index = {}
+    for src, rules in δ.items():
+        for insym, popsym, dst, push in rules:
+            index.setdefault((src, insym, popsym), []).append((dst, push))
+    return index
+
+
+def _keys(a, top):
+    """Perechile (intrare, vârf) care se pot potrivi cu (a, top), fără dubluri."""
+    ins  = (a, '$') if a != '$' else ('$',)
+    pops = (top, '$') if top != '$' else ('$',)
+    return [(i, p) for i in ins for p in pops]
+
+
+# DETERMINISM
+#
+# Două reguli din aceeaşi stare intră în conflict dacă pot fi aplicabile
+# simultan: simbolurile de intrare sunt egale sau una e λ, IAR simbolurile
+# scoase sunt egale sau una nu scoate nimic ('$').
+def determinism_conflicts(δ):
+    conflicts = []
+    for src in sorted(δ):
+        rules = δ[src]
+        for i, r1 in enumerate(rules):
+            for r2 in rules[i + 1:]:
+                (in1, pop1, *_), (in2, pop2, *_) = r1, r2
+                if (in1 == in2 or '$' in (in1, in2)) and (pop1 == pop2 or '$' in (pop1, pop2)):
+                    conflicts.append((src, r1, r2))
+    return conflicts
+
+
+def is_deterministic(δ):
+    return not determinism_conflicts(δ)
+
+
+# SIMULARE DPDA (o singură trecere, fără backtracking)
+#
+# Valabilă doar dacă is_deterministic(δ): la fiecare pas se aplică cel mult o
+# regulă, iar stiva e o listă modificată pe loc (vârful la final).
+# Un şir de peste max_eps λ-paşi consecutivi e tratat ca ciclu infinit.
+def accepts_dpda(word, *, start, z0, finals, index, max_eps=100_000):
+    get   = index.get
+    moves = {}                            # (stare, a, vârf) -> regula unică rezolvată
+    stack = [z0]
+    state, pos, n = start, 0, len(word)
+    eps = 0
+
+    while True:
+        if pos == n and state in finals:
+            return True                   # acceptare prin stare finală
+        a   = word[pos] if pos < n else '$'
+        top = stack[-1] if stack else '$'
+
+        key  = (state, a, top)
+        move = moves.get(key)
+        if move is None:
+            for insym, popsym in _keys(a, top):
+                rules = get((state, insym, popsym))
+                if rules:
+                    dst, push_str = rules[0]
+                    move = (insym != '$', popsym != '$', dst,
+                            list(reversed(push_str)) if push_str != '$' else [])
+                    break
+            else:
+                move = False              # nicio regulă aplicabilă
+            moves[key] = move
+        if not move:
+            return False
+
+        consumes, pops, state, pushed = move
+        if pops:
+            stack.pop()
+        stack += pushed
+        if consumes:
+            pos += 1
+            eps = 0
+        else:
+            eps += 1
+            if eps > max_eps:
+                raise RecursionError("Prea mulţi λ-paşi consecutivi (posibil ciclu infinit)")
+
+
+
 # SIMULARE PDA (nedeterminista, DFS cu backtracking)
-def accepts(word, *, start, z0, finals, δ, max_depth=10000):
-    initial_cfg = (start, 0, [z0])        # (state, pos în cuvânt, stack list)
+#
+# Stivele sunt persistente și partajate: fiecare stivă e un id întreg,
+# tops[id] = simbolul din vârf, rests[id] = id-ul stivei de sub vârf, iar
+# id-ul 0 este stiva vidă. Un push este internat după (simbol, id), deci
+# aceeași stivă are mereu același id și o ramură nouă costă O(|push|), nu o
+# copie a întregii stive. Configurațiile (stare, poziție, id stivă) deja
+# văzute nu mai sunt explorate, așa că buclele λ nu mai sunt reluate la nesfârșit.
+def accepts(word, *, start, z0, finals, δ, max_depth=10000, max_configs=1_000_000, index=None):
+    if index is None:
+        index = index_rules(δ)
+    get = index.get
+    tops, rests = ['$'], [0]              # stiva vidă: vârful „$”
+    interned = {}                         # (simbol, id dedesubt) -> id
+
+    def push(sid, c):
+        key = (c, sid)
+        nid = interned.get(key)
+        if nid is None:
+            nid = interned[key] = len(tops)
+            tops.append(c)
+            rests.append(sid)
+        return nid
+
+    n = len(word)
+    initial_cfg = (start, 0, push(0, z0))  # (state, pos în cuvânt, id stivă)
     stack = [initial_cfg]
+    seen = {initial_cfg}
 
     while stack:
-        state, pos, stiva = stack.pop()
-        if pos == len(word) and state in finals:
+        state, pos, sid = stack.pop()
+        if pos == n and state in finals:
             return True                   # acceptare prin stare finală
         if len(stack) > max_depth:
             raise RecursionError("Căutare prea adâncă (posibil ciclu infinit)")
 
         # simbol curent (sau '$' dacă am ajuns la sfârşitul cuvântului)
-        a = word[pos] if pos < len(word) else '$'
-        top = stiva[-1] if stiva else '$'
-
-        for insym, popsym, dst, push in δ[state]:
-            # testăm potrivirea simbolului de intrare
-            if insym != '$' and insym != a:
-                continue
-            # testăm potrivirea simbolului din vârful stivei
-            if popsym != '$' and popsym != top:
-                continue
-
-            # pregătim noua configuraţie
-            new_pos = pos + (0 if insym == '$' else 1)
-            new_stack = stiva.copy()
-            if popsym != '$':             # „pop” efectiv
-                new_stack.pop()
-            if push != '$':               # „push” (posibil mai multe simboluri)
-                for c in reversed(push):
-                    new_stack.append(c)
-
-            stack.append((dst, new_pos, new_stack))
+        a = word[pos] if pos < n else '$'
+        top = tops[sid]
+
+        for insym, popsym in _keys(a, top):
+            for dst, push_str in get((state, insym, popsym), ()):
+                # pregătim noua configuraţie
+                new_pos = pos + (0 if insym == '$' else 1)
+                new_sid = rests[sid] if popsym != '$' else sid   # „pop” efectiv
+                if push_str != '$':           # „push” (posibil mai multe simboluri)
+                    for c in reversed(push_str):
+                        new_sid = push(new_sid, c)
+
+                cfg = (dst, new_pos, new_sid)
+                if cfg in seen:
+                    continue                  # configurație deja explorată
+                seen.add(cfg)
+                if len(seen) > max_configs:
+                    raise RecursionError("Prea multe configurații (stiva crește probabil nelimitat)")
+                stack.append(cfg)
     return False
 
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Utilizare: python pda.py <automat.pda>")
-        sys.exit(1)
-
-    Q, Σ, Γ, q0, Z0, F, δ = load_pda(sys.argv[1])
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Simulator PDA")
+    parser.add_argument("automat", help="fișierul .pda")
+    parser.add_argument("--engine", choices=("auto", "dfs", "dpda", "earley"), default="auto",
+                        help="auto: dpda dacă automatul e determinist, altfel dfs (implicit); "
+                             "dfs: căutare cu backtracking; dpda: o singură trecere; "
+                             "earley: gramatică echivalentă + Earley, O(n³) garantat")
+    args = parser.parse_args()
+
+    Q, Σ, Γ, q0, Z0, F, δ = load_pda(args.automat)
+    index = index_rules(δ)
+
+    conflicts = determinism_conflicts(δ)
+    if conflicts:
+        src, r1, r2 = conflicts[0]
+        print(f"PDA nedeterminist: {len(conflicts)} conflicte, de exemplu în {src}: "
+              f"{' '.join(r1)} / {' '.join(r2)}", file=sys.stderr)
+    else:
+        print("PDA determinist", file=sys.stderr)
+
+    engine = args.engine
+    if engine == "auto":
+        engine = "dfs" if conflicts else "dpda"
+    if engine == "dpda" and conflicts:
+        parser.error("--engine dpda cere un PDA determinist")
+
+    def dfs(w):
+        return accepts(w, start=q0, z0=Z0, finals=F, δ=δ, index=index)
+
+    if engine == "earley":
+        from grammar import earley_accepts, pda_to_grammar
+        g = pda_to_grammar(Q, Σ, Γ, q0, Z0, F, δ)
+        run = lambda w: earley_accepts(w, g)
+    elif engine == "dpda":
+        def run(w):
+            try:
+                return accepts_dpda(w, start=q0, z0=Z0, finals=F, index=index)
+            except RecursionError:
+                return dfs(w)             # căutarea generală detectează ciclurile λ
+    else:
+        run = dfs
 
     print("Introduceţi cuvinte (Enter exit, quit, "" => stop):")
     while True:
@@ -85,5 +226,4 @@ if __name__ == "__main__":
         if w in {"quit", "exit", ""}:
             print("Ieșire...")
             break
-        verdict = accepts(w, start=q0, z0=Z0, finals=F, δ=δ)
-        print("ACCEPTAT" if verdict else "RESPINS")
+        print("ACCEPTAT" if run(w) else "RESPINS")
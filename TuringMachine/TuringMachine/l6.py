@@ -23,7 +23,17 @@ alfabet, tranzitii, stare initiala, stare finala, emulator
 
 
 
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import NamedTuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))   # rădăcina repo-ului
+import lfa_parser
+
 FPATH = __file__.rsplit("/", maxsplit=1)[0] + "/"
+MOVES = {'R': 1, 'L': -1}      # orice altă direcție (N) lasă capul pe loc
 
 def load_automata(filename):
     """
@@ -32,41 +42,12 @@ def load_automata(filename):
     Ignorează comentariile (linii care încep cu '#', dar nu sunt doar '#'),
     elimină comentariile inline (după un '#') și secțiunile goale.
     Returnează tuple (states, symbols, rules).
+    Parsarea (cu cache pe disc) este cea comună din lfa_parser.
     """
-    raw = open(FPATH + filename).read().splitlines()
-    sections, current = [], []
-    for ln in raw:
-        ln = ln.rstrip("\n")
-        if not ln.strip():
-            continue
-        if ln.strip() == "#":
-            sections.append(current)
-            current = []
-            continue
-        if ln.strip().startswith("#"):
-            continue
-        # se elimina comentariile inline
-        line = ln.split("#")[0].rstrip()
-        current.append(line)
-    if current:
-        sections.append(current)
-
-    states, symbols, rules = [], [], []
-    for sec in sections:
-        if not sec:
-            continue
-        header = sec[0].strip()
-        content = [s.strip() for s in sec[1:] if s.strip()]
-        if header == "[States]":
-            states = content
-        elif header == "[Symbols]":
-            symbols = content
-        elif header == "[Rules]":
-            for rule in content:
-                parts = rule.split()
-                if len(parts) == 5:
-                    st, sym, new_st, write_sym, move = parts
-                    rules.append((st, sym, new_st, write_sym, move))
+    sections = lfa_parser.parse(FPATH + filename)
+    states  = lfa_parser.joined(sections.get("States", ()))
+    symbols = lfa_parser.joined(sections.get("Symbols", ()))
+    rules   = [rule for rule in sections.get("Rules", ()) if len(rule) == 5]
     return states, symbols, rules
 
 def build_transitions(rules):
@@ -77,13 +58,102 @@ def build_transitions(rules):
     return { (st, sym): (new_st, write_sym, move)
              for st, sym, new_st, write_sym, move in rules }
 
-def step(tape, head, state, trans, blank):
+class Tape:
+    """
+    Bandă infinită în ambele sensuri, memorată ca un singur bytearray.
+    Fiecare simbol primește un cod de un octet (blank-ul are codul 0), iar
+    poziția logică p se află la cells[origin + p]. Când capul iese din zona
+    alocată, zona se dublează în partea respectivă, deci extinderea costă
+    O(1) amortizat în ambele sensuri. Celulele nealocate sunt blank.
+    """
+    __slots__ = ("cells", "origin", "symbols", "codes")
+
+    def __init__(self, inp="", blank='_', symbols=()):
+        self.symbols = [blank]        # cod -> simbol
+        self.codes = {blank: 0}       # simbol -> cod
+        for sym in symbols:           # coduri fixate dinainte (ex. pentru cod generat)
+            self.encode(sym)
+        for c in sorted(set(inp) - self.codes.keys(), key=inp.index):
+            self.encode(c)            # simbolurile noi, în ordinea primei apariții
+        # codificarea întregului șir se face în C, printr-un tabel pentru str.translate
+        table = {ord(c): self.codes[c] for c in self.codes if len(c) == 1}
+        self.cells = bytearray(inp.translate(table).encode("latin-1")) or bytearray(16)
+        self.origin = 0
+
+    def encode(self, sym):
+        code = self.codes.get(sym)
+        if code is None:
+            if len(self.symbols) == 256:
+                raise ValueError("Banda suportă cel mult 256 de simboluri distincte")
+            code = self.codes[sym] = len(self.symbols)
+            self.symbols.append(sym)
+        return code
+
+    def __getitem__(self, pos):
+        i = pos + self.origin
+        if 0 <= i < len(self.cells):
+            return self.symbols[self.cells[i]]
+        return self.symbols[0]
+
+    def __setitem__(self, pos, sym):
+        i = pos + self.origin
+        if not 0 <= i < len(self.cells):
+            self.reserve(pos, pos + 1)
+            i = pos + self.origin
+        self.cells[i] = self.encode(sym)
+
+    def reserve(self, lo, hi):
+        """
+        Alocă (cu blank) pozițiile lo .. hi - 1 care nu sunt încă alocate.
+        """
+        i = lo + self.origin
+        if i < 0:
+            k = max(-i, len(self.cells))
+            self.cells[0:0] = bytes(k)
+            self.origin += k
+        j = hi + self.origin
+        if j > len(self.cells):
+            self.cells.extend(bytes(max(j - len(self.cells), len(self.cells))))
+
+    def bounds(self):
+        """
+        Pozițiile (lo, hi) ale zonei ne-blank, cu hi exclus; (0, 0) dacă banda e goală.
+        """
+        lo = len(self.cells) - len(self.cells.lstrip(b"\0"))
+        hi = len(self.cells.rstrip(b"\0"))
+        if lo >= hi:
+            return 0, 0
+        return lo - self.origin, hi - self.origin
+
+    def window(self):
+        """
+        Conținutul benzii între primul și ultimul simbol ne-blank.
+        """
+        return self.decode(self.cells.strip(b"\0"))
+
+    def decode(self, data):
+        """
+        Șirul de simboluri pentru codurile din `data`, decodificat în C: cu
+        bytes.translate dacă toate simbolurile sunt caractere Latin-1, altfel
+        cu str.translate (care acceptă și simboluri de mai multe caractere).
+        """
+        symbols = self.symbols
+        if all(len(sym) == 1 and ord(sym) < 256 for sym in symbols):
+            table = bytes(map(ord, symbols)).ljust(256, b"\0")
+            return data.translate(table).decode("latin-1")
+        return data.decode("latin-1").translate(dict(enumerate(symbols)))
+
+    def __str__(self):
+        return self.window()
+
+
+def step(tape, head, state, trans):
     """
     Execută un pas de Turing:
       1. Citește simbolul la poziția `head`.
       2. Aplică regula `trans[(state, simbol)]`.
       3. Scrie simbolul nou și actualizează starea.
-      4. Mută capul (R/L/N).
+      4. Mută capul (R/L/N); banda crește singură în ambele sensuri.
     Returnează (tape, head, new_state, ok).
     """
     key = (state, tape[head])
@@ -93,35 +163,253 @@ def step(tape, head, state, trans, blank):
     tape[head] = write_sym
     if move == 'R':
         head += 1
-        if head >= len(tape):
-            tape.append(blank)
     elif move == 'L':
-        head = max(0, head - 1)
+        head -= 1
     # N = no move
     return tape, head, new_state, True
 
-def run_turing(inp, defs, trans, max_steps=10000):
+class Simulation(NamedTuple):
+    """
+    Rezultatul lui simulate: verdictul, banda finală (fără blank-urile de la
+    capete), numărul de pași executați, starea și poziția capului.
+    """
+    verdict: str    # "accept", "halt", "diverges" sau "limit"
+    tape: str
+    steps: int
+    state: str
+    head: int
+
+
+CHECK_MIN = 256   # pași minimi între două verificări ale configurației
+
+def simulate(inp, defs, trans, max_steps=None, accept='q_accept'):
+    """
+    Rulează mașina Turing pe `inp` până la un verdict:
+      "accept"   – s-a ajuns în starea `accept`;
+      "halt"     – nu există regulă pentru (stare, simbol);
+      "diverges" – mașina sigur nu se mai oprește;
+      "limit"    – s-au executat `max_steps` pași (None = fără limită).
+
+    Detectarea ciclurilor: la intervale de cel puțin CHECK_MIN pași (și cel
+    puțin cât zona alocată a benzii, ca verificarea să coste O(1) amortizat)
+    se ia o fotografie (stare, poziția capului față de primul simbol ne-blank,
+    conținutul ne-blank). Fotografiile formează un șir determinist, în care
+    repetițiile se caută cu algoritmul lui Brent; o repetiție înseamnă că
+    mașina revine la aceeași configurație (eventual translatată) și ciclează.
+    Între două fotografii pașii se execută direct pe bytearray-ul benzii, cu
+    tranzițiile codificate, fără apeluri step().
+
+    Fuga pe banda goală: dacă la două fotografii capul e în aceeași stare,
+    dincolo de ultimul simbol ne-blank, mai departe în aceeași direcție, și
+    între timp nu s-a întors înapoi peste poziția de la prima fotografie,
+    mașina repetă același drum la nesfârșit.
+    """
+    states, symbols, rules = defs
+    tape = Tape(inp, '_')
+    head = 0
+    state = states[0]  # q0
+
+    # Tranzițiile pe codurile benzii: (stare, cod) -> (stare nouă, cod scris, deplasare).
+    # Starea de acceptare nu are reguli aici, deci bucla de mai jos se oprește în ea.
+    ctrans = {(st, tape.encode(sym)): (new_st, tape.encode(w), MOVES.get(move, 0))
+              for (st, sym), (new_st, w, move) in trans.items() if st != accept}
+    rule_of = ctrans.get
+    cells = tape.cells         # reserve() modifică bytearray-ul pe loc
+
+    steps = 0
+    next_check = CHECK_MIN
+    saved, power, lam = None, 1, 1
+    right, left = {}, {}       # stare -> [poziție, extrem atins de cap de atunci]
+    low = high = head          # extremele capului de la ultima fotografie
+
+    while True:
+        # Pașii până la următoarea fotografie, direct pe bytearray, cu indici
+        # față de începutul zonei alocate (i = head + origin).
+        stop = next_check if max_steps is None else min(next_check, max_steps)
+        i = lo_i = hi_i = head + tape.origin
+        rule = True
+        while steps < stop:
+            if not 0 <= i < len(cells):
+                origin = tape.origin
+                tape.reserve(i - origin, i - origin + 1)
+                shift = tape.origin - origin
+                i, lo_i, hi_i = i + shift, lo_i + shift, hi_i + shift
+            rule = rule_of((state, cells[i]))
+            if rule is None:
+                break
+            state, cells[i], d = rule
+            i += d
+            steps += 1
+            if i < lo_i:
+                lo_i = i
+            elif i > hi_i:
+                hi_i = i
+        head = i - tape.origin
+        low = min(low, lo_i - tape.origin)
+        high = max(high, hi_i - tape.origin)
+
+        if rule is None:
+            verdict = "accept" if state == accept else "halt"
+            return Simulation(verdict, tape.window(), steps, state, head)
+        if max_steps is not None and steps >= max_steps:
+            break
+        if state == accept:
+            return Simulation("accept", tape.window(), steps, state, head)
+
+        next_check = steps + max(CHECK_MIN, len(tape.cells))
+        lo, hi = tape.bounds()
+        data = bytes(tape.cells[lo + tape.origin:hi + tape.origin])
+
+        # Brent pe șirul fotografiilor
+        snap = (state, head - lo, data)
+        if snap == saved:
+            return Simulation("diverges", tape.window(), steps, state, head)
+        if lam == power:
+            saved, power, lam = snap, power * 2, 0
+        lam += 1
+
+        # fuga pe banda goală, spre dreapta sau spre stânga
+        for rec in list(right.items()):
+            rec[1][1] = min(rec[1][1], low)
+            if rec[1][1] < rec[1][0]:
+                del right[rec[0]]
+        for rec in list(left.items()):
+            rec[1][1] = max(rec[1][1], high)
+            if rec[1][1] > rec[1][0]:
+                del left[rec[0]]
+        if head >= hi:
+            if state in right and head > right[state][0]:
+                return Simulation("diverges", tape.window(), steps, state, head)
+            right[state] = [head, head]
+        elif head < lo:
+            if state in left and head < left[state][0]:
+                return Simulation("diverges", tape.window(), steps, state, head)
+            left[state] = [head, head]
+        low = high = head
+
+    return Simulation("limit", tape.window(), steps, state, head)
+
+def run_turing(inp, defs, trans, max_steps=10000, accelerate=False):
     """
     Rulează mașina Turing pe șirul `inp` și returnează banda finală,
-    inclusiv marcatorul '$'.
+    inclusiv marcatorul '$', fără blank-urile de la capete.
     defs = (states, symbols, rules), trans = dicționar de tranziții.
+    Oprirea are loc și când simulate() arată că mașina ciclează;
+    max_steps=None înseamnă fără limită de pași.
+    Cu accelerate=True se folosește accel.run_fast (același rezultat ca
+    rularea pas cu pas, cu baleieri și macro-tranziții pe blocuri, dar fără
+    detectarea ciclurilor, deci cere o limită de pași).
     """
+    if not accelerate:
+        return simulate(inp, defs, trans, max_steps).tape
+    if max_steps is None:
+        raise ValueError("Execuția accelerată are nevoie de max_steps")
+
+    from accel import encode_transitions, run_fast
     states, symbols, rules = defs
-    blank = '_'   # simbolul blank
-    tape = list(inp) + [blank] * 50
+    tape = Tape(inp, '_')
+    run_fast(tape, 0, states[0], encode_transitions(trans, tape), max_steps)
+    return tape.window()
+
+class TuringProfile(NamedTuple):
+    """
+    Raportul întors de profile_turing.
+    """
+    steps: int
+    seconds: float
+    rule_hits: Counter     # (stare, simbol citit) -> de câte ori s-a aplicat regula
+    state_steps: Counter   # stare -> pași executați din ea
+    head_travel: int       # celule parcurse de cap (mutări R/L)
+    reversals: int         # schimbări de direcție ale capului
+    tape_min: int          # cea mai din stânga poziție atinsă de cap sau ne-blank pe bandă
+    tape_max: int          # cea mai din dreapta poziție atinsă de cap sau ne-blank pe bandă
+
+    @property
+    def extent(self):
+        return self.tape_max - self.tape_min + 1
+
+    @property
+    def seconds_per_million(self):
+        return self.seconds * 1e6 / self.steps if self.steps else 0.0
+
+    def format(self, top=10):
+        """
+        Raportul ca text, cu cele mai folosite `top` reguli.
+        """
+        lines = [
+            f"Pași: {self.steps} ({self.seconds:.3f}s, "
+            f"{self.seconds_per_million:.3f}s / milion de pași)",
+            f"Drumul capului: {self.head_travel} celule, {self.reversals} schimbări de direcție",
+            f"Banda folosită: [{self.tape_min}, {self.tape_max}] ({self.extent} celule, "
+            f"{self.steps / self.extent:.1f} pași / celulă)",
+            "Pași pe stare:",
+        ]
+        lines += [f"  {st:<12} {n}" for st, n in self.state_steps.most_common()]
+        lines.append("Reguli cele mai folosite:")
+        lines += [f"  {st} {sym:<4} {n}" for (st, sym), n in self.rule_hits.most_common(top)]
+        return "\n".join(lines)
+
+
+def profile_turing(inp, defs, trans, max_steps=10000):
+    """
+    Ca run_turing, dar măsoară execuția. Returnează (banda finală, TuringProfile).
+    Bucla este separată de cea din run_turing, deci rularea obișnuită nu
+    plătește nimic pentru instrumentare. Bucla nu detectează ciclurile, deci
+    cere o limită de pași (max_steps=None dă ValueError).
+    """
+    if max_steps is None:
+        raise ValueError("Profilarea are nevoie de max_steps")
+    states, symbols, rules = defs
+    tape = Tape(inp, '_')
     head = 0
-    state = states[0]  # q0
+    state = states[0]
 
-    for i in range(max_steps):
+    rule_hits, state_steps = Counter(), Counter()
+    travel = reversals = steps = 0
+    lo = hi = 0
+    last_move = None
+    t0 = time.perf_counter()
+    while steps < max_steps:
         if state == 'q_accept':
             break
-        tape, head, state, ok = step(tape, head, state, trans, blank)
+        key = (state, tape[head])
+        tape, new_head, new_state, ok = step(tape, head, state, trans)
         if not ok:
             break
+        rule_hits[key] += 1
+        state_steps[state] += 1
+        steps += 1
+        if new_head != head:
+            move = new_head - head
+            travel += 1
+            if last_move is not None and move != last_move:
+                reversals += 1
+            last_move = move
+            lo, hi = min(lo, new_head), max(hi, new_head)
+        head, state = new_head, new_state
 
-    return ''.join(tape)
+    # zona folosită include și simbolurile de intrare la care capul nu a ajuns
+    blo, bhi = tape.bounds()
+    if blo < bhi:
+        lo, hi = min(lo, blo), max(hi, bhi - 1)
+    report = TuringProfile(steps, time.perf_counter() - t0, rule_hits, state_steps,
+                           travel, reversals, lo, hi)
+    return tape.window(), report
 
 def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Mașină Turing pentru adunare unară")
+    parser.add_argument("--fast", action="store_true",
+                        help="execuție accelerată (baleieri și macro-tranziții)")
+    parser.add_argument("--profile", action="store_true",
+                        help="afișează numărul de pași, regulile folosite și drumul capului")
+    parser.add_argument("--max-steps", type=int, default=10000,
+                        help="numărul maxim de pași (implicit 10000, 0 = fără limită)")
+    args = parser.parse_args()
+    max_steps = args.max_steps or None
+    if args.profile and max_steps is None:
+        parser.error("--profile are nevoie de o limită de pași")
+
     # 1. Încarcă definiția
     states, symbols, rules = load_automata('masina_turing.lfa')
     # 2. Construiește tranzițiile
@@ -129,7 +417,19 @@ def main():
     # 3. Citește input de la utilizator
     inp = input("Introduceți două șiruri unare separate prin '+', ex. 111+1111: ").strip()
     # 4. Rulează și afișează rezultatul
-    result = run_turing(inp, (states, symbols, rules), trans)
+    defs = (states, symbols, rules)
+    if args.profile:
+        result, report = profile_turing(inp, defs, trans, max_steps=max_steps)
+        print(report.format())
+    elif args.fast:
+        if max_steps is None:
+            parser.error("--fast are nevoie de o limită de pași")
+        result = run_turing(inp, defs, trans, max_steps=args.max_steps, accelerate=True)
+    else:
+        sim = simulate(inp, defs, trans, max_steps=max_steps)
+        if sim.verdict != "accept":
+            print(f"Verdict: {sim.verdict} după {sim.steps} pași")
+        result = sim.tape
     print("Rezultat:", result)
 
 if __name__ == '__main__':
@@ -0,0 +1,198 @@
+"""
+ntm.py  –  Mașină Turing nedeterministă, explorată în lățime
+
+build_transitions din l6.py păstrează doar ultima regulă pentru o pereche
+(stare, simbol). Aici se păstrează toate, iar configurațiile se explorează în
+lățime, nivel cu nivel (nivelul k = configurațiile atinse după k pași).
+
+  - O configurație este (stare, poziția capului, banda) cu banda redusă la
+    zona ne-blank și poziția capului relativă la începutul ei, deci două
+    configurații care diferă doar printr-o translație sunt identice.
+  - Configurațiile deja văzute sunt ținute minte doar prin amprenta lor
+    blake2b de 16 octeți, nu prin conținut.
+  - Un nivel mare este împărțit în bucăți extinse în paralel de un
+    ProcessPoolExecutor; deduplicarea se face apoi în procesul principal.
+  - Prima ramură care ajunge în starea de acceptare oprește căutarea.
+  - Bugete: max_steps (adâncimea maximă) și max_configs (configurații
+    distincte memorate).
+
+Utilizare:
+    python ntm.py automat.lfa INPUT [--max-steps N] [--max-configs N] [--workers N]
+"""
+
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from l6 import load_automata
+
+MOVES          = {'R': 1, 'L': -1}
+PARALLEL_BELOW = 4096          # nivelurile mai mici se extind în procesul principal
+CHUNK          = 2048
+
+
+class NTMResult(NamedTuple):
+    verdict: str      # "accept", "reject" (toate ramurile s-au oprit) sau "limit"
+    tape: str         # banda ramurii care acceptă ("" altfel)
+    steps: int        # adâncimea atinsă
+    configs: int      # configurații distincte explorate
+
+
+def build_ntm_transitions(rules):
+    """
+    (stare, simbol) -> listă de (stare nouă, simbol scris, direcție), cu toate
+    regulile din fișier (duplicatele exacte sunt ignorate).
+    """
+    trans = {}
+    for st, sym, new_st, write_sym, move in rules:
+        options = trans.setdefault((st, sym), [])
+        if (new_st, write_sym, move) not in options:
+            options.append((new_st, write_sym, move))
+    return trans
+
+
+def _encode(trans, inp, blank):
+    """
+    Coduri de un octet pentru simboluri (blank = 0) și tranzițiile codificate:
+    (stare, cod) -> tuplu de (stare nouă, cod scris, deplasare).
+    """
+    symbols = [blank]
+    codes = {blank: 0}
+
+    def code(sym):
+        if sym not in codes:
+            codes[sym] = len(symbols)
+            symbols.append(sym)
+        return codes[sym]
+
+    ctrans = {(st, code(sym)): tuple((new_st, code(w), MOVES.get(move, 0))
+                                     for new_st, w, move in options)
+              for (st, sym), options in trans.items()}
+    data = bytes(code(c) for c in inp)
+    if len(symbols) > 256:
+        raise ValueError("Banda suportă cel mult 256 de simboluri distincte")
+    return symbols, ctrans, data
+
+
+def _normalize(state, head, data):
+    """Taie blank-urile de la capete și mută poziția capului corespunzător."""
+    stripped = data.lstrip(b"\0")
+    head -= len(data) - len(stripped)
+    return state, head, stripped.rstrip(b"\0")
+
+
+def _digest(cfg):
+    state, head, data = cfg
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{state}\0{head}\0".encode())
+    h.update(data)
+    return h.digest()
+
+
+def _successors(cfg, ctrans):
+    state, head, data = cfg
+    sym = data[head] if 0 <= head < len(data) else 0
+    for new_state, w, d in ctrans.get((state, sym), ()):
+        if 0 <= head < len(data):
+            new = data[:head] + bytes((w,)) + data[head + 1:]
+            pos = head
+        elif w == 0:
+            new, pos = data, head          # blank peste blank: banda nu se schimbă
+        elif head < 0:
+            new = bytes((w,)) + bytes(-head - 1) + data
+            pos = 0
+        else:
+            new = data + bytes(head - len(data)) + bytes((w,))
+            pos = head
+        offset = pos - head                # cu cât s-a deplasat originea
+        yield _normalize(new_state, head + offset + d, new)
+
+
+# Tranzițiile sunt trimise o singură dată fiecărui proces, la pornire.
+_WORKER_TRANS = None
+
+
+def _init_worker(ctrans):
+    global _WORKER_TRANS
+    _WORKER_TRANS = ctrans
+
+
+def _expand_chunk(chunk):
+    """Extinde o bucată de nivel; întoarce lista (amprentă, configurație)."""
+    return [(_digest(child), child)
+            for cfg in chunk for child in _successors(cfg, _WORKER_TRANS)]
+
+
+def run_ntm(inp, states, trans, *, max_steps=1000, max_configs=1_000_000,
+            workers=None, blank='_', accept='q_accept'):
+    """
+    Explorează în lățime mașina nedeterministă cu tranzițiile `trans`
+    (de la build_ntm_transitions) pornind din states[0] și întoarce un NTMResult.
+    `workers` = numărul de procese (None = os.cpu_count(), 1 = fără paralelism).
+    """
+    symbols, ctrans, data = _encode(trans, inp, blank)
+    decode = lambda d: "".join(symbols[c] for c in d)
+
+    start = _normalize(states[0], 0, data)
+    if start[0] == accept:
+        return NTMResult("accept", decode(start[2]), 0, 1)
+    seen = {_digest(start)}
+    frontier = [start]
+    workers = workers or os.cpu_count() or 1
+    pool = None
+
+    try:
+        for depth in range(1, max_steps + 1):
+            if len(frontier) >= PARALLEL_BELOW and workers > 1:
+                if pool is None:
+                    pool = ProcessPoolExecutor(workers, initializer=_init_worker,
+                                               initargs=(ctrans,))
+                chunks = [frontier[i:i + CHUNK] for i in range(0, len(frontier), CHUNK)]
+                produced = (item for part in pool.map(_expand_chunk, chunks) for item in part)
+            else:
+                produced = ((_digest(child), child)
+                            for cfg in frontier for child in _successors(cfg, ctrans))
+
+            nxt = []
+            for key, child in produced:
+                if key in seen:
+                    continue
+                if child[0] == accept:
+                    return NTMResult("accept", decode(child[2]), depth, len(seen) + 1)
+                if len(seen) >= max_configs:
+                    return NTMResult("limit", "", depth, len(seen))
+                seen.add(key)
+                nxt.append(child)
+            if not nxt:
+                return NTMResult("reject", "", depth, len(seen))
+            frontier = nxt
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    return NTMResult("limit", "", max_steps, len(seen))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Mașină Turing nedeterministă (BFS)")
+    parser.add_argument("automat", help="fișierul .lfa (relativ la directorul scriptului)")
+    parser.add_argument("input", nargs="?", default="", help="conținutul inițial al benzii")
+    parser.add_argument("--max-steps", type=int, default=1000,
+                        help="adâncimea maximă a căutării (implicit 1000)")
+    parser.add_argument("--max-configs", type=int, default=1_000_000,
+                        help="configurații distincte memorate (implicit 1000000)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="numărul de procese (implicit: toate nucleele)")
+    args = parser.parse_args()
+
+    states, symbols, rules = load_automata(args.automat)
+    result = run_ntm(args.input, states, build_ntm_transitions(rules),
+                     max_steps=args.max_steps, max_configs=args.max_configs,
+                     workers=args.workers)
+    print(f"Verdict: {result.verdict} (adâncime {result.steps}, "
+          f"{result.configs} configurații)")
+    if result.verdict == "accept":
+        print("Rezultat:", result.tape)
@@ -0,0 +1,208 @@
+"""
+tm_codegen.py  –  Compilează o mașină Turing într-o funcție Python specializată
+
+Interpretorul din l6.py plătește la fiecare pas o cheie-tuplu, o căutare în
+dicționar, despachetarea regulii și compararea direcției cu 'R'/'L'. Aici
+tranzițiile întoarse de build_transitions sunt transformate în cod sursă:
+stările și simbolurile devin întregi, banda este bytearray-ul unui Tape, iar
+funcția generată `run` are doar variabile locale și un lanț de `if` pe stare,
+apoi pe simbolul citit:
+
+    while steps < limit:
+        ...                        # extinderea benzii, dacă e nevoie
+        c = cells[i]
+        if state == 0:             # q0
+            if c == 2:             # q0 + -> q0 1 R
+                cells[i] = 3
+                i += 1
+                steps += 1
+            elif c == 3:           # q0 1 -> q0 1 R
+                i += 1
+                steps += 1
+            ...
+
+Sursa generată este păstrată în __tmcache__/, lângă fișierul .lfa, sub numele
+hash-ului sha256 al conținutului .lfa; o nouă rulare pe același fișier doar
+încarcă modulul. A doua linie a fișierului din cache conține cheia și
+sha256-ul restului sursei; un fișier trunchiat, editat sau pus acolo pentru
+alt .lfa nu trece verificarea și este regenerat, iar sursa verificată este
+compilată direct din memorie, nu recitită de pe disc.
+
+Utilizare:
+    python tm_codegen.py masina_turing.lfa 111+1111 [--max-steps N] [--show]
+"""
+
+import hashlib
+import os
+import types
+from pathlib import Path
+
+from l6 import FPATH, Simulation, Tape, build_transitions, load_automata
+
+VERSION   = "2"               # se schimbă când se schimbă forma codului generat
+CACHE_DIR = "__tmcache__"
+UNLIMITED = 1 << 62
+
+
+def generate_source(states, trans, blank='_', accept='q_accept'):
+    """
+    Sursa unui modul cu STATES, SYMBOLS, START, ACCEPT și funcția
+    run(cells, origin, head, state, limit) -> (cells, origin, head, state, steps).
+    """
+    names = list(dict.fromkeys([*states, *(st for st, _ in trans),
+                                *(new_st for new_st, _, _ in trans.values())]))
+    ids = {st: k for k, st in enumerate(names)}
+    symbols = list(dict.fromkeys([blank, *sorted({sym for _, sym in trans}
+                                                 | {w for _, w, _ in trans.values()} - {blank})]))
+    codes = {sym: k for k, sym in enumerate(symbols)}
+    acc = ids.get(accept, -1)
+
+    by_state = {}
+    for (st, sym), rule in trans.items():
+        by_state.setdefault(st, []).append((codes[sym], sym, rule))
+
+    out = [
+        f"# generat de tm_codegen.py (versiunea {VERSION}); nu se editează manual",
+        f"STATES  = {names!r}",
+        f"SYMBOLS = {symbols!r}",
+        "START   = 0",
+        f"ACCEPT  = {acc}",
+        "",
+        "",
+        "def run(cells, origin, head, state, limit):",
+        "    i = head + origin",
+        "    n = len(cells)",
+        "    steps = 0",
+        "    while steps < limit:",
+        "        if i < 0:",
+        "            k = max(-i, n)",
+        "            cells[0:0] = bytes(k)",
+        "            origin += k",
+        "            i += k",
+        "            n += k",
+        "        elif i >= n:",
+        "            k = max(i + 1 - n, n)",
+        "            cells.extend(bytes(k))",
+        "            n += k",
+        "        c = cells[i]",
+    ]
+    keyword = "if"
+    for st in names:
+        sid = ids[st]
+        if sid == acc:
+            out.append(f"        {keyword} state == {sid}:    # {st}")
+            out.append("            break")
+            keyword = "elif"
+            continue
+        rules = sorted(by_state.get(st, []))
+        if not rules:
+            continue
+        out.append(f"        {keyword} state == {sid}:    # {st}")
+        keyword = "elif"
+        inner = "if"
+        for code, sym, (new_st, write_sym, move) in rules:
+            out.append(f"            {inner} c == {code}:    # {st} {sym} -> {new_st} {write_sym} {move}")
+            inner = "elif"
+            if codes[write_sym] != code:
+                out.append(f"                cells[i] = {codes[write_sym]}")
+            if move == 'R':
+                out.append("                i += 1")
+            elif move == 'L':
+                out.append("                i -= 1")
+            if ids[new_st] != sid:
+                out.append(f"                state = {ids[new_st]}")
+            out.append("                steps += 1")
+        out.append("            else:")
+        out.append("                break")
+    if keyword == "elif":
+        out += ["        else:", "            break"]
+    else:
+        out.append("        break")             # mașină fără reguli
+    out.append("    return cells, origin, i - origin, state, steps")
+    return "\n".join(out) + "\n"
+
+
+def _seal(source, key):
+    """Adaugă linia de verificare: cheia din cache și sha256-ul sursei."""
+    first, body = source.split("\n", 1)
+    return f"{first}\n# sha256 {key} {hashlib.sha256(body.encode()).hexdigest()}\n{body}"
+
+
+def _verified(path, key):
+    """
+    Sursa din cache fără linia de verificare, sau None dacă fișierul lipsește,
+    nu corespunde cheii ori a fost modificat.
+    """
+    try:
+        first, check, body = path.read_text(encoding="utf-8").split("\n", 2)
+    except (OSError, UnicodeDecodeError, ValueError):
+        return None
+    if check != f"# sha256 {key} {hashlib.sha256(body.encode()).hexdigest()}":
+        return None
+    return f"{first}\n{body}"
+
+
+def _load(source, path):
+    module = types.ModuleType(f"tm_{path.stem}")
+    module.__file__ = str(path)
+    exec(compile(source, str(path), "exec"), module.__dict__)
+    return module
+
+
+def compile_machine(filename, accept='q_accept'):
+    """
+    Întoarce modulul generat pentru fișierul .lfa (relativ la FPATH, ca în
+    load_automata), din cache dacă există deja o compilare a aceluiași conținut.
+    """
+    src_path = Path(FPATH + filename)
+    digest = hashlib.sha256(src_path.read_bytes() + f"|{VERSION}|{accept}".encode()).hexdigest()
+    cache_dir = src_path.parent / CACHE_DIR
+    cached = cache_dir / f"{digest}.py"
+    source = _verified(cached, digest)
+    if source is None:
+        states, symbols, rules = load_automata(filename)
+        source = generate_source(states, build_transitions(rules), accept=accept)
+        cache_dir.mkdir(exist_ok=True)
+        tmp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+        tmp.write_text(_seal(source, digest), encoding="utf-8")
+        tmp.replace(cached)            # atomic: alte procese văd fișierul complet
+    return _load(source, cached)
+
+
+def run_compiled(machine, inp, max_steps=10000):
+    """
+    Rulează funcția generată pe `inp`; întoarce o l6.Simulation cu același
+    verdict, bandă și număr de pași ca rularea pas cu pas („diverges” nu este
+    detectat aici – execuția se oprește doar la limită).
+    """
+    tape = Tape(inp, machine.SYMBOLS[0], machine.SYMBOLS[1:])
+    limit = UNLIMITED if max_steps is None else max_steps
+    tape.cells, tape.origin, head, state, steps = machine.run(
+        tape.cells, tape.origin, 0, machine.START, limit)
+
+    if steps >= limit:
+        verdict = "limit"
+    elif state == machine.ACCEPT:
+        verdict = "accept"
+    else:
+        verdict = "halt"
+    return Simulation(verdict, tape.window(), steps, machine.STATES[state], head)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Rulează o mașină Turing compilată în Python")
+    parser.add_argument("automat", help="fișierul .lfa (relativ la directorul scriptului)")
+    parser.add_argument("input", nargs="?", default="", help="conținutul inițial al benzii")
+    parser.add_argument("--max-steps", type=int, default=10000,
+                        help="numărul maxim de pași (implicit 10000, 0 = fără limită)")
+    parser.add_argument("--show", action="store_true", help="afișează sursa generată")
+    args = parser.parse_args()
+
+    machine = compile_machine(args.automat)
+    if args.show:
+        print(Path(machine.__file__).read_text(encoding="utf-8"))
+    sim = run_compiled(machine, args.input, args.max_steps or None)
+    print(f"Verdict: {sim.verdict} după {sim.steps} pași")
+    print("Rezultat:", sim.tape)
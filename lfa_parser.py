@@ -0,0 +1,168 @@
+"""
+lfa_parser.py  –  Parser comun pentru fișierele de automate din toate laboratoarele
+
+Înțelege ambele dialecte folosite în repo:
+
+    [States]            [States]
+    q0                  q0
+    q1                  q1
+                        #
+    [Rules]             [Rules]
+    q0 a q1 # comentariu   q0 a q1
+
+  - o linie de forma [Nume] deschide secțiunea „Nume”;
+  - tot ce urmează după un „#” este comentariu, deci și separatorul „#” al
+    dialectului din l2.py / l6.py / Lab.1 devine o linie goală;
+  - liniile goale sunt ignorate.
+
+Fiecare linie utilă devine un tuplu de simboluri (linia împărțită după
+spații); numele de stări și simboluri sunt trecute prin sys.intern, așa că
+aceeași stare apare o singură dată în memorie oricâte reguli ar folosi-o.
+
+Fișierul este citit linie cu linie (iter_lines), fără a fi încărcat întreg.
+parse() adună rezultatul pe secțiuni și îl păstrează în __lfacache__/, lângă
+fișier, în format marshal: doar date (șiruri, tupluri, liste, dicționare),
+deci, spre deosebire de pickle, un cache primit odată cu un fișier străin
+nu poate executa cod la încărcare; în plus, șirurile internate rămân
+internate. La o rulare următoare, dacă fișierul are aceeași cale, același
+mtime și aceeași mărime, rezultatul este doar citit din cache; dacă s-a
+schimbat doar mtime-ul, se compară hash-ul blake2b al conținutului înainte de a
+parsa din nou.
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+from pathlib import Path
+
+VERSION   = "1"              # se schimbă când se schimbă forma rezultatului
+CACHE_DIR = "__lfacache__"
+
+
+def iter_lines(path, sections=None, digest=None):
+    """
+    Produce perechi (secțiune, tuplu de simboluri) pentru fiecare linie utilă.
+    Dacă `sections` este dat, o secțiune necunoscută sau o linie înaintea
+    primului antet produc ValueError. `digest` (un obiect hashlib) primește,
+    dacă este dat, toți octeții fișierului.
+    """
+    intern  = sys.intern
+    section = None
+    with open(path, "rb") as fh:
+        for raw in fh:
+            if digest is not None:
+                digest.update(raw)
+            line = raw.decode("utf-8")
+            if "#" in line:
+                line = line.split("#", 1)[0]
+            line = line.strip()
+            if not line:
+                continue
+            if line[0] == "[" and line[-1] == "]":
+                section = intern(line[1:-1])
+                if sections is not None and section not in sections:
+                    raise ValueError(f"Secțiune necunoscută: {section}")
+                continue
+            if section is None and sections is not None:
+                raise ValueError(f"Linie în afara unei secțiuni: »{line}«")
+            yield section, tuple(map(intern, line.split()))
+
+
+def joined(lines):
+    """Liniile unei secțiuni ca șiruri (o stare / un simbol pe linie)."""
+    return [t[0] if len(t) == 1 else " ".join(t) for t in lines]
+
+
+def _parse(path):
+    digest = hashlib.blake2b(digest_size=16)
+    result = {}
+    for section, tokens in iter_lines(path, digest=digest):
+        result.setdefault(section, []).append(tokens)
+    return result, digest.digest()
+
+
+def _file_digest(path):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as fh:
+        while block := fh.read(1 << 20):
+            digest.update(block)
+    return digest.digest()
+
+
+def _check(result, sections):
+    if sections is None:
+        return result
+    for section in result:
+        if section is None:
+            raise ValueError(f"Linie în afara unei secțiuni: »{' '.join(result[None][0])}«")
+        if section not in sections:
+            raise ValueError(f"Secțiune necunoscută: {section}")
+    return result
+
+
+def _load_cache(cached):
+    try:
+        with open(cached, "rb") as fh:
+            entry = marshal.load(fh)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if type(entry) is not tuple or len(entry) != 6 or type(entry[5]) is not dict:
+        return None
+    return entry
+
+
+def _store_cache(cached, entry):
+    try:
+        cached.parent.mkdir(exist_ok=True)
+        tmp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as fh:
+            marshal.dump(entry, fh)
+        tmp.replace(cached)            # atomic: alte procese văd fișierul complet
+    except OSError:
+        pass                           # fără cache (de ex. director read-only)
+
+
+def parse(path, sections=None, cache=True):
+    """
+    Citește fișierul și întoarce un dicționar secțiune -> listă de tupluri de
+    simboluri, în ordinea din fișier (o secțiune repetată se continuă).
+    Liniile dinaintea primului antet apar sub cheia None, dacă `sections`
+    nu este dat; altfel sunt o eroare, ca și secțiunile necunoscute.
+    """
+    path = Path(path)
+    if not cache:
+        return _check(_parse(path)[0], sections)
+
+    st     = path.stat()
+    key    = str(path.resolve())
+    cached = path.parent / CACHE_DIR / f"{path.name}.marshal"
+    entry  = _load_cache(cached)
+    if entry is not None and entry[:2] == (VERSION, key):
+        _, _, mtime, size, digest, result = entry
+        if (mtime, size) == (st.st_mtime_ns, st.st_size):
+            return _check(result, sections)
+        if size == st.st_size and digest == _file_digest(path):
+            _store_cache(cached, (VERSION, key, st.st_mtime_ns, size, digest, result))
+            return _check(result, sections)
+
+    result, digest = _parse(path)
+    _store_cache(cached, (VERSION, key, st.st_mtime_ns, st.st_size, digest, result))
+    return _check(result, sections)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Parsează un fișier de automat și afișează secțiunile")
+    parser.add_argument("fisier")
+    parser.add_argument("--no-cache", action="store_true", help="nu folosi cache-ul de pe disc")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    result = parse(args.fisier, cache=not args.no_cache)
+    elapsed = time.perf_counter() - t0
+    for section, lines in result.items():
+        print(f"[{section}] {len(lines)} linii")
+    print(f"{elapsed * 1000:.1f} ms")